@@ -0,0 +1,41 @@
+"""Disk-backed cache for consolidated meta-audit results - Phase 5."""
+
+import logging
+import os
+import shelve
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Opt-in: point AUDITOR_META_CACHE at a writable path to persist consolidated
+# meta-audit results across CLI invocations. Unset means no disk I/O at all.
+_CACHE_PATH_ENV = "AUDITOR_META_CACHE"
+
+
+def _cache_path() -> Optional[str]:
+    return os.getenv(_CACHE_PATH_ENV) or None
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """Fetch a cached meta-audit payload, or None on miss / disabled cache."""
+    path = _cache_path()
+    if path is None:
+        return None
+    try:
+        with shelve.open(path) as db:
+            return db.get(key)
+    except Exception as e:
+        logger.warning("⚠️ Meta-cache read failed (%s); recomputing.", e)
+        return None
+
+
+def put(key: str, value: Dict[str, Any]) -> None:
+    """Store a meta-audit payload; failures are logged and non-fatal."""
+    path = _cache_path()
+    if path is None:
+        return
+    try:
+        with shelve.open(path) as db:
+            db[key] = value
+    except Exception as e:
+        logger.warning("⚠️ Meta-cache write failed (%s); continuing without persistence.", e)
@@ -34,6 +34,10 @@ class EvidenceRegistry:
     def all(self) -> Dict[str, EvidenceRecord]:
         """Return the entire evidentiary store."""
         return self._store
+
+    def all_ids(self) -> frozenset[str]:
+        """Return a snapshot of all registered evidence IDs for bulk membership checks."""
+        return frozenset(self._store)
         
     def filter_by_claim(self, claim_keyword: str) -> List[EvidenceRecord]:
         """Retrieve all records related to a specific claim keyword."""
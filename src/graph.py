@@ -17,7 +17,8 @@ from src.nodes.detectives import (
 from src.nodes.judges import (
     ProsecutorNode,
     DefenseNode,
-    TechLeadNode
+    TechLeadNode,
+    BatchJudgePanelNode
 )
 from src.nodes.justice import ChiefJusticeNode
 import logging
@@ -56,6 +57,7 @@ def create_full_graph() -> StateGraph:
     builder.add_node("prosecutor", ProsecutorNode())
     builder.add_node("defense", DefenseNode())
     builder.add_node("tech_lead", TechLeadNode())
+    builder.add_node("batch_judge_panel", BatchJudgePanelNode())
     builder.add_node("chief_justice", ChiefJusticeNode())
     
     # Detective parallel fan-out
@@ -71,15 +73,19 @@ def create_full_graph() -> StateGraph:
     def should_judge(state: AgentState):
         """Route to judges only if evidence was collected."""
         if state.get_evidence_count() > 0:
+            if state.batch_mode:
+                # Non-interactive (CI/cron) audits use the 50%-cost Batch API panel
+                return ["batch_judge_panel"]
             return ["prosecutor", "defense", "tech_lead"]
         return [END]
 
     builder.add_conditional_edges("evidence_aggregator", should_judge)
-    
+
     # Judges to chief justice (fan-in)
     builder.add_edge("prosecutor", "chief_justice")
     builder.add_edge("defense", "chief_justice")
     builder.add_edge("tech_lead", "chief_justice")
+    builder.add_edge("batch_judge_panel", "chief_justice")
     
     # Chief Justice to END
     builder.add_edge("chief_justice", END)
@@ -107,7 +107,9 @@ def main():
                 "detectors": list(evidences_dict.keys())
             },
             "evidences": {
-                k: [json.loads(ev.model_dump_json()) if hasattr(ev, "model_dump_json") else json.loads(ev.json()) for ev in v]
+                # mode="json" serializes in pydantic-core directly; no
+                # dump-to-string / re-parse round trip per evidence item
+                k: [ev.model_dump(mode="json") if hasattr(ev, "model_dump") else json.loads(ev.json()) for ev in v]
                 for k, v in evidences_dict.items()
             }
         }
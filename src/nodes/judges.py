@@ -1,20 +1,52 @@
 """Judge nodes for Automaton Auditor - Phase 2."""
 
-from typing import Dict, List, Any
+import asyncio
+import io
+import json
+import os
+import time
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Sequence, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
+import openai
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential
+)
+
+from pydantic import TypeAdapter
 
 from src.state import AgentState, JudicialOpinion, Evidence
-from src.prompts.judge_prompts import (
-    PROSECUTOR_PROMPT,
-    DEFENSE_PROMPT,
-    TECH_LEAD_PROMPT
-)
+from src.prompts.judge_prompts import PROMPTS
 import logging
 logger = logging.getLogger(__name__)
 
+# Bound concurrent LLM calls so the parallel judge panel stays under
+# OpenAI TPM/RPM ceilings instead of sleeping between sequential calls.
+# The semaphore itself is created per panel run: each judge node drives its
+# own asyncio.run loop, and asyncio primitives bind to the loop they first
+# block on, so a module-level instance would break every judge after the
+# first as soon as this limit is actually reached.
+_JUDGE_CONCURRENCY = int(os.getenv("JUDGE_CONCURRENCY", "16"))
+
+# Shared fallback rubric used when the state carries no dimensions.
+# Built once at import as an immutable tuple of read-only mappings so the
+# judges never re-materialize the 7-dict list per invocation.
+_DEFAULT_RUBRIC: Tuple[Mapping[str, str], ...] = tuple(MappingProxyType(d) for d in (
+    {"id": "git_forensic_analysis", "name": "Git Forensic Analysis"},
+    {"id": "state_management_rigor", "name": "State Management Rigor"},
+    {"id": "graph_orchestration", "name": "Graph Orchestration Architecture"},
+    {"id": "safe_tool_engineering", "name": "Safe Tool Engineering"},
+    {"id": "structured_output", "name": "Structured Output Enforcement"},
+    {"id": "judicial_nuance", "name": "Judicial Nuance"},
+    {"id": "theoretical_depth", "name": "Theoretical Depth"},
+))
+
 
 class BaseJudgeNode:
     """Base class for all judge personas."""
@@ -51,16 +83,79 @@ Return ONLY the JudicialOpinion object.
         ])
         
         self.chain = self.prompt | self.structured_llm
-    
+
+    async def _preflight_probe(self) -> None:
+        """Single cheap call to fail fast on auth/config issues before fanning out."""
+        await self.llm.ainvoke("ping")
+
+    async def _ainvoke_with_retry(self, payload: Dict[str, Any], sem: asyncio.Semaphore) -> JudicialOpinion:
+        """Invoke the chain under the panel's semaphore with exponential backoff on rate limits."""
+        async with sem:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
+                wait=wait_exponential(multiplier=1, min=1, max=30),
+                stop=stop_after_attempt(5),
+                reraise=True
+            ):
+                with attempt:
+                    return await self.chain.ainvoke(payload)
+
+    async def _judge_criterion(self, state: AgentState, dim: Mapping[str, Any], fallback_score: int, fallback_note: str, batch_ts: datetime, sem: asyncio.Semaphore) -> JudicialOpinion:
+        """Evaluate a single rubric criterion, falling back to a default opinion on error."""
+        criterion_id = dim.get("id", dim.get("name", "unknown"))
+        criterion_name = dim.get("name", criterion_id)
+
+        evidence_registry = self._format_evidence_registry(state, criterion_id)
+
+        try:
+            opinion = await self._ainvoke_with_retry({
+                "judge_name": self.judge_name,
+                "criterion_name": criterion_name,
+                "criterion_id": criterion_id,
+                "evidence_registry": evidence_registry
+            }, sem)
+
+            # All opinions in one panel run share the batch timestamp
+            opinion.timestamp = batch_ts
+
+            logger.info(f"  → {criterion_id}: {opinion.score}/5")
+            return opinion
+
+        except Exception as e:
+            logger.error(f"  ❌ Error for {criterion_id}: {str(e)}")
+            return JudicialOpinion(
+                judge=self.judge_name,
+                criterion_id=criterion_id,
+                score=fallback_score,
+                argument=f"{fallback_note}: {str(e)}",
+                cited_evidence_ids=[]
+            )
+
+    async def _judge_panel(self, state: AgentState, rubric_dims: Sequence[Mapping[str, Any]], fallback_score: int, fallback_note: str) -> List[JudicialOpinion]:
+        """Fan out all criteria concurrently under the bounded semaphore."""
+        await self._preflight_probe()
+        # Fresh semaphore per run, bound to this loop
+        sem = asyncio.Semaphore(_JUDGE_CONCURRENCY)
+        # One clock read per panel run - a deterministic audit shares a timestamp
+        batch_ts = datetime.now()
+        return list(await asyncio.gather(*(
+            self._judge_criterion(state, dim, fallback_score, fallback_note, batch_ts, sem)
+            for dim in rubric_dims
+        )))
+
     def _format_evidence_registry(self, state: AgentState, criterion_id: str) -> str:
         """Create a summary of canonical registry records relevant to the criterion."""
         summary = []
-        
+        meta = state.get_criterion_meta(criterion_id)
+        cid_lower = meta["lower"]
+        cid_tokens = meta["tokens"]
+
         # Pull from the deterministic EvidenceRegistry
         for record_id, record in state.registry.all().items():
-            if record.claim_reference and (
-                criterion_id.lower() in record.claim_reference.lower() or 
-                any(word in record.claim_reference.lower() for word in criterion_id.lower().split('_'))
+            claim_lower = record.claim_reference.lower() if record.claim_reference else None
+            if claim_lower and (
+                cid_lower in claim_lower or
+                any(word in claim_lower for word in cid_tokens)
             ):
                 summary.append(
                     f"- ID: {record.id}\n"
@@ -87,62 +182,19 @@ class ProsecutorNode(BaseJudgeNode):
     """Prosecutor judge - harsh, critical."""
     
     def __init__(self):
-        super().__init__("Prosecutor", PROSECUTOR_PROMPT)
+        super().__init__("Prosecutor", PROMPTS["Prosecutor"])
     
     def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Evaluate evidence as Prosecutor."""
         logger.info("⚖️  Prosecutor: Analyzing evidence...")
         
         # Get rubric dimensions from state or use defaults
-        rubric_dims = state.rubric_dimensions
-        if not rubric_dims:
-            rubric_dims = [
-                {"id": "git_forensic_analysis", "name": "Git Forensic Analysis"},
-                {"id": "state_management_rigor", "name": "State Management Rigor"},
-                {"id": "graph_orchestration", "name": "Graph Orchestration Architecture"},
-                {"id": "safe_tool_engineering", "name": "Safe Tool Engineering"},
-                {"id": "structured_output", "name": "Structured Output Enforcement"},
-                {"id": "judicial_nuance", "name": "Judicial Nuance"},
-                {"id": "theoretical_depth", "name": "Theoretical Depth"},
-            ]
-        
-        opinions = []
-        for dim in rubric_dims:
-            criterion_id = dim.get("id", dim.get("name", "unknown"))
-            criterion_name = dim.get("name", criterion_id)
-            
-            evidence_registry = self._format_evidence_registry(state, criterion_id)
-            
-            import time
-            import random
-            time.sleep(random.uniform(1.0, 3.0)) # Stable jitter
-            
-            try:
-                opinion = self.chain.invoke({
-                    "judge_name": self.judge_name,
-                    "criterion_name": criterion_name,
-                    "criterion_id": criterion_id,
-                    "evidence_registry": evidence_registry
-                })
-                
-                # Ensure timestamp is set
-                opinion.timestamp = datetime.now()
-                opinions.append(opinion)
-                
-                logger.info(f"  → {criterion_id}: {opinion.score}/5")
-                
-            except Exception as e:
-                logger.error(f"  ❌ Error for {criterion_id}: {str(e)}")
-                # Create fallback opinion
-                fallback = JudicialOpinion(
-                    judge="Prosecutor",
-                    criterion_id=criterion_id,
-                    score=1,
-                    argument=f"Error evaluating: {str(e)}",
-                    cited_evidence_ids=[]
-                )
-                opinions.append(fallback)
+        rubric_dims = state.rubric_dimensions or _DEFAULT_RUBRIC
         
+        opinions = asyncio.run(self._judge_panel(
+            state, rubric_dims, fallback_score=1, fallback_note="Error evaluating"
+        ))
+
         return {"opinions": opinions}
 
 
@@ -150,59 +202,18 @@ class DefenseNode(BaseJudgeNode):
     """Defense judge - forgiving, rewards effort."""
     
     def __init__(self):
-        super().__init__("Defense", DEFENSE_PROMPT)
+        super().__init__("Defense", PROMPTS["Defense"])
     
     def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Evaluate evidence as Defense."""
         logger.info("🛡️  Defense: Analyzing evidence...")
         
-        rubric_dims = state.rubric_dimensions
-        if not rubric_dims:
-            rubric_dims = [
-                {"id": "git_forensic_analysis", "name": "Git Forensic Analysis"},
-                {"id": "state_management_rigor", "name": "State Management Rigor"},
-                {"id": "graph_orchestration", "name": "Graph Orchestration Architecture"},
-                {"id": "safe_tool_engineering", "name": "Safe Tool Engineering"},
-                {"id": "structured_output", "name": "Structured Output Enforcement"},
-                {"id": "judicial_nuance", "name": "Judicial Nuance"},
-                {"id": "theoretical_depth", "name": "Theoretical Depth"},
-            ]
-        
-        opinions = []
-        for dim in rubric_dims:
-            criterion_id = dim.get("id", dim.get("name", "unknown"))
-            criterion_name = dim.get("name", criterion_id)
-            
-            evidence_registry = self._format_evidence_registry(state, criterion_id)
-            
-            import time
-            import random
-            time.sleep(random.uniform(1.0, 3.0)) # Stable jitter
-            
-            try:
-                opinion = self.chain.invoke({
-                    "judge_name": self.judge_name,
-                    "criterion_name": criterion_name,
-                    "criterion_id": criterion_id,
-                    "evidence_registry": evidence_registry
-                })
-                
-                opinion.timestamp = datetime.now()
-                opinions.append(opinion)
-                
-                logger.info(f"  → {criterion_id}: {opinion.score}/5")
-                
-            except Exception as e:
-                logger.error(f"  ❌ Error for {criterion_id}: {str(e)}")
-                fallback = JudicialOpinion(
-                    judge="Defense",
-                    criterion_id=criterion_id,
-                    score=3,
-                    argument=f"Error evaluating, defaulting to average: {str(e)}",
-                    cited_evidence_ids=[]
-                )
-                opinions.append(fallback)
+        rubric_dims = state.rubric_dimensions or _DEFAULT_RUBRIC
         
+        opinions = asyncio.run(self._judge_panel(
+            state, rubric_dims, fallback_score=3, fallback_note="Error evaluating, defaulting to average"
+        ))
+
         return {"opinions": opinions}
 
 
@@ -210,58 +221,142 @@ class TechLeadNode(BaseJudgeNode):
     """Tech Lead judge - pragmatic, production focus."""
     
     def __init__(self):
-        super().__init__("TechLead", TECH_LEAD_PROMPT)
+        super().__init__("TechLead", PROMPTS["TechLead"])
     
     def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Evaluate evidence as Tech Lead."""
         logger.info("🔧  TechLead: Analyzing evidence...")
         
-        rubric_dims = state.rubric_dimensions
-        if not rubric_dims:
-            rubric_dims = [
-                {"id": "git_forensic_analysis", "name": "Git Forensic Analysis"},
-                {"id": "state_management_rigor", "name": "State Management Rigor"},
-                {"id": "graph_orchestration", "name": "Graph Orchestration Architecture"},
-                {"id": "safe_tool_engineering", "name": "Safe Tool Engineering"},
-                {"id": "structured_output", "name": "Structured Output Enforcement"},
-                {"id": "judicial_nuance", "name": "Judicial Nuance"},
-                {"id": "theoretical_depth", "name": "Theoretical Depth"},
-            ]
+        rubric_dims = state.rubric_dimensions or _DEFAULT_RUBRIC
         
-        opinions = []
-        for dim in rubric_dims:
-            criterion_id = dim.get("id", dim.get("name", "unknown"))
-            criterion_name = dim.get("name", criterion_id)
-            
-            evidence_registry = self._format_evidence_registry(state, criterion_id)
-            
-            import time
-            import random
-            time.sleep(random.uniform(1.0, 3.0)) # Stable jitter
-            
-            try:
-                opinion = self.chain.invoke({
-                    "judge_name": self.judge_name,
-                    "criterion_name": criterion_name,
-                    "criterion_id": criterion_id,
-                    "evidence_registry": evidence_registry
-                })
-                
-                opinion.timestamp = datetime.now()
-                opinions.append(opinion)
-                
-                logger.info(f"  → {criterion_id}: {opinion.score}/5")
-                
-            except Exception as e:
-                logger.error(f"  ❌ Error for {criterion_id}: {str(e)}")
-                fallback = JudicialOpinion(
-                    judge="TechLead",
+        opinions = asyncio.run(self._judge_panel(
+            state, rubric_dims, fallback_score=3, fallback_note="Error evaluating, assuming average"
+        ))
+
+        return {"opinions": opinions}
+
+
+
+class BatchJudgePanelNode:
+    """Runs the full judge panel through the OpenAI Batch API.
+
+    Intended for CI/cron audits where latency does not matter: all
+    (judge, criterion) requests are written to a JSONL file, submitted as
+    a single batch (24h completion window, ~50% of interactive cost), and
+    polled until complete. Interactive runs keep the async judge path.
+    """
+
+    POLL_INTERVAL_SECONDS = 30
+
+    def __init__(self):
+        self.judges = [ProsecutorNode(), DefenseNode(), TechLeadNode()]
+        self.client = openai.OpenAI()
+        self._opinion_adapter = TypeAdapter(JudicialOpinion)
+
+    def _build_batch_requests(self, state: AgentState, rubric_dims: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """Materialize one /v1/chat/completions request per (judge, criterion) pair."""
+        requests = []
+        role_map = {"system": "system", "human": "user"}
+
+        for judge in self.judges:
+            for dim in rubric_dims:
+                criterion_id = dim.get("id", dim.get("name", "unknown"))
+                criterion_name = dim.get("name", criterion_id)
+
+                messages = judge.prompt.format_messages(
+                    judge_name=judge.judge_name,
+                    criterion_name=criterion_name,
                     criterion_id=criterion_id,
-                    score=3,
-                    argument=f"Error evaluating, assuming average: {str(e)}",
+                    evidence_registry=judge._format_evidence_registry(state, criterion_id)
+                )
+
+                requests.append({
+                    "custom_id": f"{judge.judge_name}:{criterion_id}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": "gpt-4o-mini",
+                        "temperature": 0,
+                        "response_format": {"type": "json_object"},
+                        "messages": [
+                            {"role": role_map.get(m.type, "user"),
+                             "content": m.content + "\nRespond with a single JSON object matching the JudicialOpinion schema."}
+                            for m in messages
+                        ]
+                    }
+                })
+        return requests
+
+    def _poll_until_complete(self, batch_id: str):
+        """Block until the batch reaches a terminal state."""
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                return batch
+            logger.info(f"  ⏳ Batch {batch_id} status: {batch.status}. Polling again in {self.POLL_INTERVAL_SECONDS}s...")
+            time.sleep(self.POLL_INTERVAL_SECONDS)
+
+    def _parse_output_line(self, line: str, batch_ts: datetime) -> JudicialOpinion:
+        """Parse one batch output line back into a JudicialOpinion."""
+        entry = json.loads(line)
+        judge_name, criterion_id = entry["custom_id"].split(":", 1)
+
+        try:
+            content = entry["response"]["body"]["choices"][0]["message"]["content"]
+            opinion = self._opinion_adapter.validate_json(content)
+            opinion.timestamp = batch_ts
+            return opinion
+        except Exception as e:
+            logger.error(f"  ❌ Batch parse error for {entry['custom_id']}: {str(e)}")
+            return JudicialOpinion(
+                judge=judge_name,
+                criterion_id=criterion_id,
+                score=1 if judge_name == "Prosecutor" else 3,
+                argument=f"Error parsing batch response: {str(e)}",
+                cited_evidence_ids=[]
+            )
+
+    def __call__(self, state: AgentState) -> Dict[str, Any]:
+        """Submit all judge/criterion requests as one batch and collect opinions."""
+        logger.info("📦 BatchJudgePanel: Submitting non-interactive batch audit...")
+
+        rubric_dims = state.rubric_dimensions or _DEFAULT_RUBRIC
+
+        requests = self._build_batch_requests(state, rubric_dims)
+        jsonl_payload = "\n".join(json.dumps(r) for r in requests).encode("utf-8")
+
+        try:
+            batch_file = self.client.files.create(
+                file=io.BytesIO(jsonl_payload),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"  📤 Batch submitted: {batch.id} ({len(requests)} requests)")
+
+            batch = self._poll_until_complete(batch.id)
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"Batch ended with status '{batch.status}'")
+
+            output = self.client.files.content(batch.output_file_id).text
+            batch_ts = datetime.now()
+            opinions = [self._parse_output_line(line, batch_ts) for line in output.splitlines() if line.strip()]
+            logger.info(f"  ✅ Batch complete: {len(opinions)} opinions collected")
+
+        except Exception as e:
+            logger.error(f"  ❌ Batch audit failed: {str(e)}")
+            opinions = [
+                JudicialOpinion(
+                    judge=judge.judge_name,
+                    criterion_id=dim.get("id", dim.get("name", "unknown")),
+                    score=1 if judge.judge_name == "Prosecutor" else 3,
+                    argument=f"Batch audit failed: {str(e)}",
                     cited_evidence_ids=[]
                 )
-                opinions.append(fallback)
-        
-        return {"opinions": opinions}
+                for judge in self.judges for dim in rubric_dims
+            ]
 
+        return {"opinions": opinions}
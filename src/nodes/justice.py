@@ -1,48 +1,288 @@
 """Chief Justice node for Automaton Auditor - Layer 3."""
 
-from typing import Dict, Any, List
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
 from src.state import AgentState, AuditReport, CriterionResult
 import logging
 logger = logging.getLogger(__name__)
 
+# Optional multi-pattern matcher: one automaton scan per evidence goal
+# instead of a substring probe per (criterion, token) pair
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Fixed judge panel: index into 3-slot arrays instead of hashing name strings
+JUDGES = ("Prosecutor", "Defense", "TechLead")
+PROS, DEF, TL = 0, 1, 2
+_JUDGE_IDX = {judge: i for i, judge in enumerate(JUDGES)}
+_ALL_JUDGES_MASK = 0b111
+
+
+def _mask_to_names(valid_mask: int) -> List[str]:
+    """Expand a 3-bit judge validity mask back to names (for traces)."""
+    return [JUDGES[i] for i in range(3) if valid_mask & (1 << i)]
+
+
+# Criterion category flags: substring-probe the ID once per criterion,
+# then every rule tests a bit instead of rescanning the string
+CAT_ARCH, CAT_ORCH, CAT_SEC, CAT_STATE, CAT_TEST = 1, 2, 4, 8, 16
+_CATEGORY_PROBES = (
+    ("architecture", CAT_ARCH),
+    ("orchestration", CAT_ORCH),
+    ("safe", CAT_SEC),
+    ("security", CAT_SEC),
+    ("state", CAT_STATE),
+    ("test", CAT_TEST),
+)
+
+
+@lru_cache(maxsize=256)
+def _criterion_pattern(probes: tuple) -> re.Pattern:
+    """Compiled alternation over a criterion's probe strings.
+
+    Cached at module level: the probe tuples are pure functions of the rubric
+    IDs, so repeated index builds (and meta-audit replays) reuse the same
+    compiled pattern instead of paying re.compile per call.
+    """
+    return re.compile("|".join(re.escape(p) for p in probes))
+
+
+@lru_cache(maxsize=256)
+def _pretty(criterion_id: str) -> str:
+    """Human-readable dimension name for a criterion ID, memoized across audits."""
+    return criterion_id.replace("_", " ").title()
+
+
+def _category_flags(cid_lower: str) -> int:
+    """Fold the category substring probes into one int bitmask."""
+    flags = 0
+    for probe, bit in _CATEGORY_PROBES:
+        if probe in cid_lower:
+            flags |= bit
+    return flags
+
+
+@dataclass(slots=True)
+class AuditCtx:
+    """
+    Mutable per-criterion scoring context.
+
+    Passed by reference through the deterministic rules so helpers mutate
+    one slotted object instead of packing/unpacking multi-value tuples at
+    every step. trace is None when trace capture is disabled.
+    """
+    scores: List[int] = field(default_factory=lambda: [3, 3, 3])
+    override_score: Optional[int] = None
+    status: str = "PASSED"
+    remediation: str = "Continue tracking."
+    dissent: Optional[str] = None
+    trace: Optional[List[str]] = None
+    valid_mask: int = _ALL_JUDGES_MASK
+
 class ChiefJusticeNode:
     """Collects opinions and synthesizes the Deterministic Chief Justice verdict with Intelligence Amplification."""
-    
-    def _detect_cross_evidence_contradiction(self, state: AgentState, criterion_id: str) -> tuple[bool, str]:
+
+    def __init__(self):
+        # Trace capture defaults on (tests and benchmarks read the traces);
+        # production runs can opt out to skip all trace string formatting
+        self.enable_trace = os.getenv("AUDITOR_ENABLE_TRACE", "1") != "0"
+
+    def _build_evidence_soa(self, state: AgentState) -> Dict[str, Any]:
+        """
+        Flatten state.evidences into a struct-of-arrays layout.
+
+        Goals stay as a parallel list of lowercased strings; confidence and
+        found flags become NumPy arrays so per-criterion aggregates are
+        vectorized reductions instead of per-object attribute walks.
+        """
+        evidence, goal_lower, detectors, conf, found = [], [], [], [], []
+        is_doc, is_repo = [], []
+        for detector, ev_list in state.evidences.items():
+            doc_flag = detector == "doc"
+            repo_flag = detector == "repo"
+            for ev in ev_list:
+                evidence.append(ev)
+                goal_lower.append(ev.goal_lower)
+                detectors.append(detector)
+                conf.append(ev.confidence)
+                found.append(ev.found)
+                is_doc.append(doc_flag)
+                is_repo.append(repo_flag)
+        return {
+            "evidence": evidence,
+            "goal_lower": goal_lower,
+            "detector": detectors,
+            "conf": np.asarray(conf, dtype=np.float64),
+            "found": np.asarray(found, dtype=bool),
+            "is_doc": np.asarray(is_doc, dtype=bool),
+            "is_repo": np.asarray(is_repo, dtype=bool),
+        }
+
+    def _build_evidence_index(self, state: AgentState, criterion_ids) -> Dict[str, Dict[str, Any]]:
+        """
+        Bucket evidences per criterion in a single pass over state.evidences.
+
+        Matching rule mirrors the legacy scans: a criterion is relevant to an
+        evidence item when its full lowercase ID or any underscore token is a
+        substring of the lowercase goal. Aggregates (found/missing counts and
+        max confidence over found items) are computed in the same pass so the
+        per-criterion loops become O(1) lookups.
+        """
+        index = {
+            cid: {
+                "repo": [],
+                "max_conf": 0.0, "found": 0, "missing": 0,
+                "doc_claims": False, "repo_missing": False,
+            }
+            for cid in criterion_ids
+        }
+        probes_by_cid = {}
+        for cid in index:
+            meta = state.get_criterion_meta(cid)
+            probes_by_cid[cid] = (meta["lower"], *meta["tokens"])
+
+        automaton = self._build_criterion_automaton(probes_by_cid) if index else None
+        if automaton is None:
+            # Fallback: one precompiled alternation per criterion - a single
+            # C-level scan per goal instead of K Python-level `in` probes
+            patterns_by_cid = {
+                cid: _criterion_pattern(probes) for cid, probes in probes_by_cid.items()
+            }
+
+        soa = self._build_evidence_soa(state)
+        match_rows = {cid: [] for cid in index}
+
+        for i, goal_lower in enumerate(soa["goal_lower"]):
+            if automaton is not None:
+                # Single O(|goal|) automaton scan yields all matching criteria
+                matched = {cid for _, cids in automaton.iter(goal_lower) for cid in cids}
+            else:
+                matched = {
+                    cid for cid, patt in patterns_by_cid.items()
+                    if patt.search(goal_lower)
+                }
+            ev = soa["evidence"][i]
+            is_repo_row = soa["is_repo"][i]
+            for cid in matched:
+                if is_repo_row:
+                    # Only the repo bucket is read downstream (implicit-missing rule)
+                    index[cid]["repo"].append(ev)
+                match_rows[cid].append(i)
+
+        # Fused aggregation over the matched rows per criterion; the
+        # contradiction signals come out of the same reduction
+        conf_arr, found_arr = soa["conf"], soa["found"]
+        doc_arr, repo_arr = soa["is_doc"], soa["is_repo"]
+        for cid, rows in match_rows.items():
+            if not rows:
+                continue
+            idx = np.asarray(rows, dtype=np.intp)
+            bucket = index[cid]
+            (
+                bucket["found"], bucket["missing"], bucket["max_conf"],
+                bucket["doc_claims"], bucket["repo_missing"],
+            ) = self._agg(idx, conf_arr, found_arr, doc_arr, repo_arr)
+
+        return index
+
+    @staticmethod
+    def _agg(idx: np.ndarray, conf: np.ndarray, found: np.ndarray, is_doc: np.ndarray, is_repo: np.ndarray) -> tuple[int, int, float, bool, bool]:
+        """
+        Fused per-criterion reduction over matched evidence rows.
+
+        One kernel emits (found_count, missing_count, max_confidence over
+        found rows, doc_claims, repo_missing) so callers never re-walk the
+        evidence list. The detector role rides along as is_doc/is_repo bool
+        arrays, keeping contradiction signals inside the same reduction.
+        """
+        found_rows = found[idx]
+        conf_rows = conf[idx]
+        found_cnt = int(found_rows.sum())
+        missing_cnt = int(idx.size) - found_cnt
+        conf_found = conf_rows[found_rows]
+        max_conf = float(conf_found.max()) if conf_found.size else 0.0
+        confident = conf_rows > 0.6
+        doc_claims = bool((found_rows & is_doc[idx] & confident).any())
+        repo_missing = bool((~found_rows & is_repo[idx] & confident).any())
+        return found_cnt, missing_cnt, max_conf, doc_claims, repo_missing
+
+    @staticmethod
+    def _build_criterion_automaton(probes_by_cid: Dict[str, tuple]):
+        """Compile all criterion probes into one Aho-Corasick automaton, or None without the dependency."""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        word_to_cids: Dict[str, List[str]] = {}
+        for cid, probes in probes_by_cid.items():
+            for probe in probes:
+                word_to_cids.setdefault(probe, []).append(cid)
+        automaton = ahocorasick.Automaton()
+        for word, cids in word_to_cids.items():
+            automaton.add_word(word, cids)
+        automaton.make_automaton()
+        return automaton
+
+    def _detect_cross_evidence_contradiction(self, state: AgentState, criterion_id: str, evidence_index: Dict[str, Dict[str, Any]] = None) -> tuple[bool, str]:
         """
         Phase 3 Intel: Compare doc claims vs repo reality.
         Returns: (has_contradiction, explanation)
         """
-        doc_claims_found = False
-        repo_evidence_missing = False
-        
-        # Scour doc evidence
-        if 'doc' in state.evidences:
-            for ev in state.evidences['doc']:
-                if (criterion_id.lower() in ev.goal.lower() or 
-                    any(word in ev.goal.lower() for word in criterion_id.lower().split('_'))):
-                    if ev.found and ev.confidence > 0.6:
-                        doc_claims_found = True
-                        
-        # Scour repo evidence
-        if 'repo' in state.evidences:
-            relevant_repo = False
-            for ev in state.evidences['repo']:
-                if (criterion_id.lower() in ev.goal.lower() or 
-                    any(word in ev.goal.lower() for word in criterion_id.lower().split('_'))):
-                    relevant_repo = True
-                    if not ev.found and ev.confidence > 0.6:
-                        repo_evidence_missing = True
-            
-            # If repo scanned but found *no* relevant files explicitly, missing is implicitly True
-            if doc_claims_found and not relevant_repo and len(state.evidences['repo']) > 0:
-                repo_evidence_missing = True
-                
+        # A contradiction needs a doc claim *and* repo evidence to contradict
+        # it; repo-only or doc-only audits can never trip this rule, so skip
+        # the whole per-criterion pass in that common asymmetric case.
+        if 'doc' not in state.evidences or 'repo' not in state.evidences:
+            return False, ""
+
+        if evidence_index is None or criterion_id not in evidence_index:
+            evidence_index = self._build_evidence_index(state, [criterion_id])
+        bucket = evidence_index[criterion_id]
+
+        # Signals were computed during index construction; no re-scan here
+        doc_claims_found = bucket["doc_claims"]
+        repo_evidence_missing = bucket["repo_missing"]
+
+        # If repo scanned but found *no* relevant files explicitly, missing is implicitly True
+        if doc_claims_found and not bucket["repo"] and len(state.evidences.get('repo', [])) > 0:
+            repo_evidence_missing = True
+
         if doc_claims_found and repo_evidence_missing:
             return True, f"Documentation claims structural existence for '{criterion_id}', but static repository forensic tools explicitly could not find supporting code artifacts."
-            
+
         return False, ""
 
+    def _batch_detect_contradictions(self, state: AgentState, evidence_index: Dict[str, Dict[str, Any]]) -> Dict[str, tuple[bool, str]]:
+        """
+        Verdicts for every indexed criterion from one walk over the index.
+
+        The O(E) evidence work already happened when the index was built; this
+        just folds the per-criterion signals into (has_contradiction, msg)
+        pairs, hoisting the doc/repo presence checks out of the criterion loop.
+        """
+        if 'doc' not in state.evidences or 'repo' not in state.evidences:
+            return {cid: (False, "") for cid in evidence_index}
+
+        repo_scanned = len(state.evidences.get('repo', [])) > 0
+        contra_map = {}
+        for criterion_id, bucket in evidence_index.items():
+            doc_claims_found = bucket["doc_claims"]
+            repo_evidence_missing = bucket["repo_missing"] or (
+                doc_claims_found and repo_scanned and not bucket["repo"]
+            )
+            if doc_claims_found and repo_evidence_missing:
+                contra_map[criterion_id] = (True, f"Documentation claims structural existence for '{criterion_id}', but static repository forensic tools explicitly could not find supporting code artifacts.")
+            else:
+                contra_map[criterion_id] = (False, "")
+        return contra_map
+
     def _generate_fact_supremacy_table(self, state: AgentState) -> str:
         """
         Phase 4 Master Thinker: Generate a 'Verified vs Hallucinated' path table.
@@ -68,6 +308,13 @@ class ChiefJusticeNode:
         table += "| Claimed Path (DOC) | Forensic Status | Artifact ID |\n"
         table += "| :--- | :--- | :--- |\n"
         
+        # Snapshot (path, id) pairs once: the claim loop below would otherwise
+        # pay two Pydantic descriptor lookups per record per claim
+        path_records = [
+            (record.artifact_path, record.id)
+            for record in state.registry.all().values() if record.artifact_path
+        ]
+
         hallucination_count = 0
         for claim in sorted(doc_claims):
             if not claim.endswith('.py') and '/' not in claim: # Basic filter for noise
@@ -76,11 +323,7 @@ class ChiefJusticeNode:
             status = "✅ VERIFIED" if is_verified else "❌ HALLUCINATION"
             if not is_verified: hallucination_count += 1
             
-            art_id = "N/A"
-            for record in state.registry.all().values():
-                if record.artifact_path and claim in record.artifact_path:
-                    art_id = record.id
-                    break
+            art_id = next((rid for path, rid in path_records if claim in path), "N/A")
             table += f"| `{claim}` | **{status}** | {art_id} |\n"
             
         if hallucination_count > 0:
@@ -88,115 +331,172 @@ class ChiefJusticeNode:
             
         return table
 
-    def _apply_calibrated_override(self, max_confidence: float, criterion_id: str, remediation: str, dissent_summary: str, reasoning_trace: List[str]) -> tuple[int, str, str, str, List[str]]:
+    @staticmethod
+    def _apply_calibrated_override(ctx: AuditCtx, max_confidence: float, criterion_id: str) -> None:
         """
         Step 1: Calibrated Override (Phase 3).
-        Graduated penalty based on evidence confidence.
-        Returns: (score_override, status, remediation, dissent, trace)
+        Graduated penalty based on evidence confidence; mutates ctx in place.
         """
         if max_confidence < 0.3:
-            logger.info(f"  🚨 CALIBRATED OVERRIDE: Heavy penalty for {criterion_id} (Confidence: {max_confidence:.2f})")
-            remediation = f"CRITICAL MISSING COMPONENT: No tangible artifacts found matching {criterion_id}."
-            dissent_summary = "Overruled judges; confidence threshold not met for architectural claims."
-            reasoning_trace.append(f"Calibrated Override Triggered: Heavy penalty (Score 1) due to low evidence confidence ({max_confidence:.2f}).")
-            return 1, "OVERRIDE_HEAVY", remediation, dissent_summary, reasoning_trace
-        
+            logger.info("  🚨 CALIBRATED OVERRIDE: Heavy penalty for %s (Confidence: %.2f)", criterion_id, max_confidence)
+            ctx.remediation = f"CRITICAL MISSING COMPONENT: No tangible artifacts found matching {criterion_id}."
+            ctx.dissent = "Overruled judges; confidence threshold not met for architectural claims."
+            ctx.override_score = 1
+            ctx.status = "OVERRIDE_HEAVY"
+            if ctx.trace is not None:
+                ctx.trace.append(f"Calibrated Override Triggered: Heavy penalty (Score 1) due to low evidence confidence ({max_confidence:.2f}).")
+            return
+
         if max_confidence < 0.7:
-            logger.info(f"  ⚠️ CALIBRATED OVERRIDE: Moderate penalty for {criterion_id} (Confidence: {max_confidence:.2f})")
-            remediation = f"GENERIC IMPLEMENTATION: Only basic signals found for {criterion_id}. Lacks advanced architectural patterns."
-            reasoning_trace.append(f"Calibrated Override Triggered: Moderate penalty (Cap 2) due to mid-range evidence confidence ({max_confidence:.2f}).")
-            return 2, "OVERRIDE_MODERATE", remediation, dissent_summary, reasoning_trace
-            
-        reasoning_trace.append(f"Calibrated Override Passed: Sufficient evidence confidence ({max_confidence:.2f}).")
-        return None, "PASSED", remediation, dissent_summary, reasoning_trace
+            logger.info("  ⚠️ CALIBRATED OVERRIDE: Moderate penalty for %s (Confidence: %.2f)", criterion_id, max_confidence)
+            ctx.remediation = f"GENERIC IMPLEMENTATION: Only basic signals found for {criterion_id}. Lacks advanced architectural patterns."
+            ctx.override_score = 2
+            ctx.status = "OVERRIDE_MODERATE"
+            if ctx.trace is not None:
+                ctx.trace.append(f"Calibrated Override Triggered: Moderate penalty (Cap 2) due to mid-range evidence confidence ({max_confidence:.2f}).")
+            return
 
-    def _apply_security_override(self, criterion_id: str, scores: Dict[str, int], remediation: str, reasoning_trace: List[str]) -> tuple[int, str, List[str]] | tuple[None, str, List[str]]:
-        """Step 2: Security Override."""
-        if "safe" in criterion_id.lower() or "security" in criterion_id.lower():
-            if scores["Prosecutor"] <= 3:
+        if ctx.trace is not None:
+            ctx.trace.append(f"Calibrated Override Passed: Sufficient evidence confidence ({max_confidence:.2f}).")
+
+    @staticmethod
+    def _apply_security_override(ctx: AuditCtx, cat_flags: int) -> Optional[int]:
+        """Step 2: Security Override. Mutates ctx; returns the capped score if triggered."""
+        scores = ctx.scores
+        if cat_flags & CAT_SEC:
+            if scores[PROS] <= 3:
                 logger.info("  🚨 RULE OF SECURITY: Prosecutor identified security flaw. Score capped at 3.")
-                remediation = "IMMEDIATE FIX REQUIRED: Security/safety vulnerabilities detected by Prosecutor must be patched."
-                reasoning_trace.append(f"Security Override Triggered: Prosecutor score ({scores['Prosecutor']}) capped final score at 3.")
-                return min(scores["TechLead"], 3), remediation, reasoning_trace # Use techlead as base but cap
-            reasoning_trace.append("Security Override Passed: Prosecutor did not identify safety flaws.")
-        return None, remediation, reasoning_trace
-
-    def _perform_variance_arbitration(self, scores: Dict[str, int], arguments: Dict[str, str], max_confidence: float, dissent_summary: str, reasoning_trace: List[str]) -> tuple[List[str], str, List[str]]:
-        """Step 3: Variance Arbitration - Prune factual outliers with sensitivity delta."""
-        valid_judges = ["Prosecutor", "Defense", "TechLead"]
-        max_score = max(scores.values())
-        min_score = min(scores.values())
+                ctx.remediation = "IMMEDIATE FIX REQUIRED: Security/safety vulnerabilities detected by Prosecutor must be patched."
+                if ctx.trace is not None:
+                    ctx.trace.append(f"Security Override Triggered: Prosecutor score ({scores[PROS]}) capped final score at 3.")
+                return min(scores[TL], 3) # Use techlead as base but cap
+            if ctx.trace is not None:
+                ctx.trace.append("Security Override Passed: Prosecutor did not identify safety flaws.")
+        return None
+
+    @staticmethod
+    def _perform_variance_arbitration(ctx: AuditCtx, max_confidence: float) -> None:
+        """Step 3: Variance Arbitration - Prune factual outliers with sensitivity delta.
+
+        Rebuilds ctx.valid_mask (3 bits over Prosecutor, Defense, TechLead).
+        """
+        scores = ctx.scores
+        valid_mask = _ALL_JUDGES_MASK
+        pros, defn, tl = scores
+        min_score = min(scores)
+        max_score = max(scores)
         variance = max_score - min_score
-        
+
         if variance > 1.5:
-            logger.warning(f"  ⚠️ HIGH VARIANCE DETECTED (Δ{variance}): Resolving judge disagreement.")
-            dissent_summary = (
+            logger.warning("  ⚠️ HIGH VARIANCE DETECTED (Δ%s): Resolving judge disagreement.", variance)
+            ctx.dissent = (
                 f"Judicial disagreement observed (Δ{variance}).\n"
                 f"Explanation: Chief Justice arbitrating based on architectural evidence context."
             )
-            
-            # Find median
-            sorted_scores = sorted(scores.values())
-            median = sorted_scores[1]
-            
-            # Find extreme outlier (largest absolute deviation)
-            outlier_judge = None
+
+            # Median of three is whatever is left after removing min and max
+            median = pros + defn + tl - min_score - max_score
+
+            # Find extreme outlier (largest absolute deviation) in one pass
+            # over precomputed deviations - no repeated list indexing
+            outlier_idx = -1
             max_dev = -1
-            for judge, score in scores.items():
-                dev = abs(score - median)
+            for i, dev in enumerate((abs(pros - median), abs(defn - median), abs(tl - median))):
                 if dev > max_dev:
                     max_dev = dev
-                    outlier_judge = judge
-            
-            if outlier_judge and max_dev > 1:
-                outlier_score = scores[outlier_judge]
+                    outlier_idx = i
+
+            if outlier_idx >= 0 and max_dev > 1:
+                outlier_judge = JUDGES[outlier_idx]
+                outlier_score = scores[outlier_idx]
                 # Cross-reference with confidence
                 if outlier_score > 3 and max_confidence < 0.4:
-                    logger.info(f"  ❌ PRUNING HIGH OUTLIER ({outlier_judge}): Score {outlier_score} lacks confidence {max_confidence}.")
-                    valid_judges.remove(outlier_judge)
-                    reasoning_trace.append(f"Variance Arbitration: Pruned high outlier '{outlier_judge}' ({outlier_score}) due to low evidence confidence ({max_confidence:.2f}).")
+                    logger.info("  ❌ PRUNING HIGH OUTLIER (%s): Score %d lacks confidence %s.", outlier_judge, outlier_score, max_confidence)
+                    valid_mask &= ~(1 << outlier_idx)
+                    if ctx.trace is not None:
+                        ctx.trace.append(f"Variance Arbitration: Pruned high outlier '{outlier_judge}' ({outlier_score}) due to low evidence confidence ({max_confidence:.2f}).")
                 elif outlier_score < 2 and max_confidence > 0.7:
-                    logger.info(f"  ❌ PRUNING LOW OUTLIER ({outlier_judge}): Score {outlier_score} ignores high confidence {max_confidence}.")
-                    valid_judges.remove(outlier_judge)
-                    reasoning_trace.append(f"Variance Arbitration: Pruned low outlier '{outlier_judge}' ({outlier_score}) despite high evidence confidence ({max_confidence:.2f}).")
-                else:
-                    reasoning_trace.append(f"Variance Arbitration: Outlier '{outlier_judge}' ({outlier_score}) kept within calibrated bounds.")
-        else:
-            reasoning_trace.append(f"Variance Arbitration Passed: Variance (Δ{variance}) within stable limits.")
+                    logger.info("  ❌ PRUNING LOW OUTLIER (%s): Score %d ignores high confidence %s.", outlier_judge, outlier_score, max_confidence)
+                    valid_mask &= ~(1 << outlier_idx)
+                    if ctx.trace is not None:
+                        ctx.trace.append(f"Variance Arbitration: Pruned low outlier '{outlier_judge}' ({outlier_score}) despite high evidence confidence ({max_confidence:.2f}).")
+                elif ctx.trace is not None:
+                    ctx.trace.append(f"Variance Arbitration: Outlier '{outlier_judge}' ({outlier_score}) kept within calibrated bounds.")
+        elif ctx.trace is not None:
+            ctx.trace.append(f"Variance Arbitration Passed: Variance (Δ{variance}) within stable limits.")
 
-        return valid_judges, dissent_summary, reasoning_trace
+        ctx.valid_mask = valid_mask
 
-    def _apply_functionality_weight_and_median(self, criterion_id: str, scores: Dict[str, int], valid_judges: List[str], reasoning_trace: List[str]) -> tuple[int, List[str]]:
+    @staticmethod
+    def _apply_functionality_weight_and_median(ctx: AuditCtx, cat_flags: int) -> int:
         """Step 4 & 5: Functionality Weighting or Median Stabilization."""
-        if not valid_judges:
-            reasoning_trace.append("Fallback: All judges pruned. Base score set to 1.")
-            return 1, reasoning_trace # Fallback if all pruned
-            
-        if ("architecture" in criterion_id.lower() or "orchestration" in criterion_id.lower()) and "TechLead" in valid_judges:
+        scores = ctx.scores
+        valid_mask = ctx.valid_mask
+        if not valid_mask:
+            if ctx.trace is not None:
+                ctx.trace.append("Fallback: All judges pruned. Base score set to 1.")
+            return 1 # Fallback if all pruned
+
+        if cat_flags & (CAT_ARCH | CAT_ORCH) and valid_mask & (1 << TL):
             logger.info("  🏛️ RULE OF FUNCTIONALITY: Tech Lead opinion carries highest weight.")
-            # Gather valid scores
-            valid_scores = [scores[j] for j in valid_judges]
-            
             # Apply 2x multiplier only for TechLead's *weight* in the average
             weighted_sum = 0
             total_weight = 0
-            for j in valid_judges:
-                if j == "TechLead":
-                    weighted_sum += (2 * scores[j])
-                    total_weight += 2
-                else:
-                    weighted_sum += scores[j]
-                    total_weight += 1
-                    
+            for i in range(3):
+                if not valid_mask & (1 << i):
+                    continue
+                weight = 2 if i == TL else 1
+                weighted_sum += weight * scores[i]
+                total_weight += weight
+
             final_score = round(weighted_sum / total_weight)
-            reasoning_trace.append(f"Functionality Weighting Applied: 2x multiplier for TechLead. Final valid judges: {valid_judges}. Score: {final_score}")
-            return final_score, reasoning_trace
-            
+            if ctx.trace is not None:
+                ctx.trace.append(f"Functionality Weighting Applied: 2x multiplier for TechLead. Final valid judges: {_mask_to_names(valid_mask)}. Score: {final_score}")
+            return final_score
+
         # Step 5: Median Stabilization
-        valid_scores = [scores[j] for j in valid_judges]
-        final_score = round(sum(valid_scores) / len(valid_scores))
-        reasoning_trace.append(f"Median Stabilization Applied: Computed rounded mean of valid judges: {valid_judges}. Score: {final_score}")
-        return final_score, reasoning_trace
+        valid_sum = valid_count = 0
+        for i in range(3):
+            if valid_mask & (1 << i):
+                valid_sum += scores[i]
+                valid_count += 1
+        final_score = round(valid_sum / valid_count)
+        if ctx.trace is not None:
+            ctx.trace.append(f"Median Stabilization Applied: Computed rounded mean of valid judges: {_mask_to_names(valid_mask)}. Score: {final_score}")
+        return final_score
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _synthesize_deterministic(criterion_id: str, max_confidence: float, cat_flags: int, valid_mask: int, scores: tuple, has_contradiction: bool) -> tuple[int, int, int, str, Optional[str]]:
+        """
+        Memoized pure core of scoring steps 1-6 for trace-off runs.
+
+        The verdict is a deterministic function of these hashable inputs, and
+        meta-audits replay the same criteria with recurring score triples, so
+        repeated (criterion, scores, evidence) combinations hit the cache.
+        Returns (final_score, base_score, penalty, remediation, dissent).
+        """
+        ctx = AuditCtx(scores=list(scores), valid_mask=valid_mask)
+        ChiefJusticeNode._apply_calibrated_override(ctx, max_confidence, criterion_id)
+        if ctx.status == "OVERRIDE_HEAVY":
+            final_score = ctx.override_score
+        else:
+            sec_score = ChiefJusticeNode._apply_security_override(ctx, cat_flags) if cat_flags & CAT_SEC else None
+            if sec_score is not None:
+                final_score = sec_score
+            else:
+                ChiefJusticeNode._perform_variance_arbitration(ctx, max_confidence)
+                final_score = ChiefJusticeNode._apply_functionality_weight_and_median(ctx, cat_flags)
+                if ctx.status == "OVERRIDE_MODERATE":
+                    final_score = min(final_score, ctx.override_score)
+
+        base_score = final_score
+        penalty = 0
+        if has_contradiction:
+            final_score = max(1, final_score - 2)
+            penalty = base_score - final_score
+        final_score = max(1, min(5, final_score))
+        return final_score, base_score, penalty, ctx.remediation, ctx.dissent
 
     def __call__(self, state: AgentState) -> Dict[str, Any]:
         """Aggregate opinions via deterministic rules and produce final AuditReport."""
@@ -206,160 +506,200 @@ class ChiefJusticeNode:
             logger.warning("\n⚠️  No opinions to aggregate")
             return {}
         
-        logger.info("\n" + "="*70)
-        logger.info("⚖️  CHIEF JUSTICE OPINION SYNTHESIS".center(70))
-        logger.info("="*70)
+        # All per-criterion logging is INFO; checking the level once lets the
+        # hottest loop bodies skip the logging machinery entirely
+        info_on = logger.isEnabledFor(logging.INFO)
+
+        if info_on:
+            logger.info("\n" + "="*70)
+            logger.info("⚖️  CHIEF JUSTICE OPINION SYNTHESIS".center(70))
+            logger.info("="*70)
         
-        # Group by criterion
-        by_criterion = {}
+        # Group by criterion. defaultdict keeps first-seen criterion order
+        # (a sort + groupby would reorder the final report); once grouping is
+        # done, disable the factory so stray lookups can't grow empty groups.
+        by_criterion = defaultdict(list)
         for op in opinions:
-            if op.criterion_id not in by_criterion:
-                by_criterion[op.criterion_id] = []
             by_criterion[op.criterion_id].append(op)
+        by_criterion.default_factory = None
             
         final_criteria_results = []
         global_contradictions = []
-        
+        # Bound-method caches: these appends run once or more per criterion
+        results_append = final_criteria_results.append
+        contradictions_append = global_contradictions.append
+
+        # Coherence-guard anchors, tracked while results are built (first match
+        # wins, same as the old next() scans over the finished list)
+        arch_crit = state_crit = test_crit = None
+
+        # One pass over all evidences; every per-criterion scan below is a lookup
+        evidence_index = self._build_evidence_index(state, by_criterion.keys())
+
+        # Snapshot registry IDs once: citation validation becomes a plain
+        # set-membership test instead of a registry method call per citation
+        valid_ids = state.registry.all_ids()
+
+        # One verdict map for every criterion; no per-criterion detection call
+        contra_map = self._batch_detect_contradictions(state, evidence_index)
+
         for criterion_id, ops in by_criterion.items():
-            logger.info(f"\n📋 Evaluating: {criterion_id}")
+            if info_on:
+                logger.info("\n📋 Evaluating: %s", criterion_id)
+
+            # Lower/token/title forms are pure functions of the ID - compute once
+            meta = state.get_criterion_meta(criterion_id)
+            cid_lower = meta["lower"]
+            cat_flags = _category_flags(cid_lower)
+            dimension_name = _pretty(criterion_id)
             
-            # Map judge scores and arguments
-            scores = {"Prosecutor": 3, "Defense": 3, "TechLead": 3}
-            arguments = {}
-            cited_evidences = {}
+            ctx = AuditCtx(trace=[] if self.enable_trace else None)
+
+            # Map judge scores into the fixed 3-slot context array
+            scores = ctx.scores
+            cited_evidences = [(), (), ()]  # empty tuples: no per-slot list alloc
             for op in ops:
-                scores[op.judge] = op.score
-                arguments[op.judge] = op.argument
-                cited_evidences[op.judge] = getattr(op, "cited_evidence_ids", [])
-                logger.info(f"  [{op.judge}] {op.score}/5 - {op.argument[:70]}...")
-            
+                i = _JUDGE_IDX[op.judge]
+                scores[i] = op.score
+                cited_evidences[i] = getattr(op, "cited_evidence_ids", [])
+                if info_on:
+                    logger.info("  [%s] %d/5 - %.70s...", op.judge, op.score, op.argument)
+
             # Gather evidence facts and max confidence for this criterion
-            evidence_found_count = 0
-            evidence_missing_count = 0
-            max_confidence = 0.0
-            for det, ev_list in state.evidences.items():
-                for ev in ev_list:
-                    if (criterion_id.lower() in ev.goal.lower() or 
-                        any(word in ev.goal.lower() for word in criterion_id.lower().split('_'))):
-                        if ev.found:
-                            evidence_found_count += 1
-                            max_confidence = max(max_confidence, ev.confidence)
-                        else:
-                            evidence_missing_count += 1
-
-            valid_judges = ["Prosecutor", "Defense", "TechLead"]
-            dissent_summary = None
-            remediation = "Continue tracking."
-            reasoning_trace = []
-            
+            bucket = evidence_index[criterion_id]
+            evidence_found_count = bucket["found"]
+            evidence_missing_count = bucket["missing"]
+            max_confidence = bucket["max_conf"]
+
             # Step 0: Citation Validation (Hallucination Guard)
-            for judge in list(valid_judges):
-                citations = cited_evidences.get(judge, [])
-                for cit in citations:
-                    if not state.registry.exists(cit):
-                        logger.info(f"  ❌ PRUNING JUDGE ({judge}): Hallucinated citation ID '{cit}'.")
-                        valid_judges.remove(judge)
-                        reasoning_trace.append(f"Citation Validation: Judge {judge} pruned due to invalid citation: {cit}.")
+            for i in range(3):
+                for cit in cited_evidences[i]:
+                    if cit not in valid_ids:
+                        logger.info("  ❌ PRUNING JUDGE (%s): Hallucinated citation ID '%s'.", JUDGES[i], cit)
+                        ctx.valid_mask &= ~(1 << i)
+                        if ctx.trace is not None:
+                            ctx.trace.append(f"Citation Validation: Judge {JUDGES[i]} pruned due to invalid citation: {cit}.")
                         break
-            
-            # Step 1: Calibrated Override (Architectural Governance)
-            override_score, status, remediation, dissent_summary, reasoning_trace = self._apply_calibrated_override(
-                max_confidence, criterion_id, remediation, dissent_summary, reasoning_trace
-            )
-            
-            # Step 2: Security Override
-            sec_score, sec_remediation, reasoning_trace = self._apply_security_override(
-                criterion_id, scores, remediation, reasoning_trace
-            )
-            
-            if status == "OVERRIDE_HEAVY":
-                final_score = override_score
-            elif sec_score is not None:
-                final_score = sec_score
-                remediation = sec_remediation
-            else:
-                # Step 3: Variance Arbitration
-                valid_judges, dissent_summary, reasoning_trace = self._perform_variance_arbitration(
-                    scores, arguments, max_confidence, dissent_summary, reasoning_trace
-                )
-                
-                # Step 4 & 5: Functionality Weight or Median Stabilization
-                final_score, reasoning_trace = self._apply_functionality_weight_and_median(
-                    criterion_id, scores, valid_judges, reasoning_trace
+
+            # Step 6 signal is computed up front: it is an input to the
+            # memoized core, and an output of the shared evidence index
+            has_contradiction, contra_msg = contra_map[criterion_id]
+
+            if ctx.trace is None:
+                # Trace-off runs route through the memoized pure core;
+                # identical inputs recur across meta-audit replays
+                (final_score, base_score, penalty_applied,
+                 ctx.remediation, ctx.dissent) = self._synthesize_deterministic(
+                    criterion_id, max_confidence, cat_flags, ctx.valid_mask,
+                    tuple(scores), has_contradiction,
                 )
-                
-                # If moderate override, cap the score
-                if status == "OVERRIDE_MODERATE":
-                    final_score = min(final_score, override_score)
-            
-            base_score = final_score
-            penalty_applied = 0
-            
-            # Step 6: Global Rule of Contradiction (Phase 3 Intelligence Amplification)
-            has_contradiction, contra_msg = self._detect_cross_evidence_contradiction(state, criterion_id)
+            else:
+                # Step 1: Calibrated Override (Architectural Governance)
+                self._apply_calibrated_override(ctx, max_confidence, criterion_id)
+
+                # Heavy override forces the score to 1; the remaining scoring
+                # rules cannot change the verdict, so skip straight to Step 6.
+                if ctx.status == "OVERRIDE_HEAVY":
+                    final_score = ctx.override_score
+                else:
+                    # Step 2: Security Override (only relevant for safety criteria)
+                    sec_score = self._apply_security_override(ctx, cat_flags) if cat_flags & CAT_SEC else None
+
+                    if sec_score is not None:
+                        final_score = sec_score
+                    else:
+                        # Step 3: Variance Arbitration
+                        self._perform_variance_arbitration(ctx, max_confidence)
+
+                        # Step 4 & 5: Functionality Weight or Median Stabilization
+                        final_score = self._apply_functionality_weight_and_median(ctx, cat_flags)
+
+                        # If moderate override, cap the score
+                        if ctx.status == "OVERRIDE_MODERATE":
+                            final_score = min(final_score, ctx.override_score)
+
+                base_score = final_score
+                penalty_applied = 0
+
+                # Step 6: Global Rule of Contradiction (Phase 3 Intelligence Amplification)
+                if has_contradiction:
+                    final_score = max(1, final_score - 2)
+                    ctx.trace.append(f"Contradiction Penalty Applied: Deducted {base_score - final_score} points. -> {contra_msg}")
+                    penalty_applied = base_score - final_score
+
+                final_score = max(1, min(5, final_score))
+                ctx.trace.append(f"Final Score Locked: {final_score}/5.")
+
             if has_contradiction:
-                logger.info(f"  🧠 PHASE 3 INTELLIGENCE: CROSS-EVIDENCE CONTRADICTION DETECTED.")
-                logger.info(f"     -> {contra_msg}")
-                final_score = max(1, final_score - 2)
-                reasoning_trace.append(f"Contradiction Penalty Applied: Deducted {base_score - final_score} points. -> {contra_msg}")
-                penalty_applied = base_score - final_score
-                remediation = f"RESOLVE CONTRADICTION: {contra_msg}"
-                global_contradictions.append(contra_msg)
-            
-            final_score = max(1, min(5, final_score))
-            reasoning_trace.append(f"Final Score Locked: {final_score}/5.")
-            logger.info(f"  ⭐ Final Synthesized Score: {final_score}/5")
+                logger.info("  🧠 PHASE 3 INTELLIGENCE: CROSS-EVIDENCE CONTRADICTION DETECTED.")
+                logger.info("     -> %s", contra_msg)
+                ctx.remediation = f"RESOLVE CONTRADICTION: {contra_msg}"
+                contradictions_append(contra_msg)
+
+            if info_on:
+                logger.info("  ⭐ Final Synthesized Score: %d/5", final_score)
             
-            # Save criterion result
-            final_criteria_results.append(CriterionResult(
+            # Save criterion result. Every field below is produced by our own
+            # deterministic rules (scores already clamped to 1-5), so skip
+            # Pydantic validation via model_construct.
+            result = CriterionResult.model_construct(
                 dimension_id=criterion_id,
-                dimension_name=criterion_id.replace("_", " ").title(),
+                dimension_name=dimension_name,
                 final_score=final_score,
                 base_score=base_score,
                 penalty_applied=penalty_applied,
-                prosecutor_score=scores["Prosecutor"],
-                defense_score=scores["Defense"],
-                tech_lead_score=scores["TechLead"],
-                dissent_summary=dissent_summary,
+                prosecutor_score=scores[PROS],
+                defense_score=scores[DEF],
+                tech_lead_score=scores[TL],
+                dissent_summary=ctx.dissent,
                 contradiction_flag=has_contradiction,
-                reasoning_trace=reasoning_trace,
-                remediation=remediation
-            ))
-            
+                reasoning_trace=ctx.trace if ctx.trace is not None else [],
+                remediation=ctx.remediation
+            )
+            results_append(result)
+
+            # Index coherence anchors in the same pass
+            if arch_crit is None and cat_flags & CAT_ARCH:
+                arch_crit = result
+            if state_crit is None and cat_flags & CAT_STATE:
+                state_crit = result
+            if test_crit is None and cat_flags & CAT_TEST:
+                test_crit = result
+
         # --- Step 7: Cross-Criterion Coherence Guards (Phase 3 Systemic Intelligence) ---
-        # Map criteria by ID for quick lookup
-        crit_map = {c.dimension_id.lower(): c for c in final_criteria_results}
-        
         # 1. Architecture high but state management low
-        arch_crit = next((c for c in final_criteria_results if "architecture" in c.dimension_id.lower()), None)
-        state_crit = next((c for c in final_criteria_results if "state" in c.dimension_id.lower()), None)
         if arch_crit and state_crit and arch_crit.final_score >= 4 and state_crit.final_score <= 2:
             logger.info("  🧠 SYSTEMIC COHERENCE: Penalizing Architecture due to poor state management.")
             arch_crit.final_score -= 1
-            arch_crit.reasoning_trace.append("Systemic Coherence Penalty: Architecture score reduced by 1 because State Management validation failed downstream.")
+            if self.enable_trace:
+                arch_crit.reasoning_trace.append("Systemic Coherence Penalty: Architecture score reduced by 1 because State Management validation failed downstream.")
             global_contradictions.append("Systemic Incoherence: High abstraction (Architecture) built on failing foundation (State Management).")
 
         # 2. Testing missing but overall > 4 context (simplified to: if testing is 1, no other score can be 5)
-        test_crit = next((c for c in final_criteria_results if "test" in c.dimension_id.lower()), None)
         if test_crit and test_crit.final_score == 1:
             for c in final_criteria_results:
                 if c.final_score == 5 and c.dimension_id != test_crit.dimension_id:
-                    logger.info(f"  🧠 SYSTEMIC COHERENCE: Capping {c.dimension_id} at 4 because testing is entirely missing.")
+                    logger.info("  🧠 SYSTEMIC COHERENCE: Capping %s at 4 because testing is entirely missing.", c.dimension_id)
                     c.final_score = 4
-                    c.reasoning_trace.append("Systemic Coherence Cap: Score capped at 4. Perfection (5) cannot be claimed without verifiable tests.")
+                    if self.enable_trace:
+                        c.reasoning_trace.append("Systemic Coherence Cap: Score capped at 4. Perfection (5) cannot be claimed without verifiable tests.")
                     
         # Generate Final Audit Report
-        overall_score_sum = sum(c.final_score for c in final_criteria_results)
-        overall_avg = overall_score_sum / len(final_criteria_results) if final_criteria_results else 0.0
-        logger.info(f"\n🏆 CHIEF JUSTICE OVERALL VERDICT: {overall_avg:.1f}/5.0")
+        # Reduce in NumPy; read after the coherence guards so capped scores count
+        n_criteria = len(final_criteria_results)
+        final_scores = np.fromiter(
+            (c.final_score for c in final_criteria_results), dtype=np.int8, count=n_criteria
+        )
+        overall_avg = float(final_scores.mean()) if n_criteria else 0.0
+        logger.info("\n🏆 CHIEF JUSTICE OVERALL VERDICT: %.1f/5.0", overall_avg)
         logger.info("="*70 + "\n")
-        
-        evidence_summary_dict = {k: len(v) for k, v in state.evidences.items()}
+
+        evidence_summary_dict = dict(zip(state.evidences.keys(), map(len, state.evidences.values())))
         
         # Generate Fact Supremacy Table
         fact_table = self._generate_fact_supremacy_table(state)
         
-        final_report = AuditReport(
+        final_report = AuditReport.model_construct(
             repo_url=state.repo_url,
             executive_summary=f"Automaton Auditor examined the repository and rendered a final score of {overall_avg:.1f}/5.0. See criterion breakdown for exact flaws and mitigating factors.{fact_table}",
             overall_score=overall_avg,
@@ -381,20 +721,21 @@ class ChiefJusticeNode:
         
         for crit_id, score in adjusted_scores.items():
             # Check for low stability evidence that might have inflated the score
+            crit_lc = crit_id.lower()
             relevant_evidence = [
                 ev for ev in meta_registry.values()
-                if ev.claim_reference and crit_id.lower() in ev.claim_reference.lower()
+                if ev.claim_reference and crit_lc in ev.claim_reference.lower()
             ]
             
             if relevant_evidence:
                 avg_stability = sum(ev.stability_score for ev in relevant_evidence) / len(relevant_evidence)
                 if avg_stability < 0.7:
-                    logger.warning(f"  ⚠️ SYSTEMIC UNCERTAINTY: Penalizing {crit_id} due to unstable evidence (Stability: {avg_stability:.2f})")
+                    logger.warning("  ⚠️ SYSTEMIC UNCERTAINTY: Penalizing %s due to unstable evidence (Stability: %.2f)", crit_id, avg_stability)
                     penalty = 0.5 if avg_stability < 0.5 else 0.2
                     adjusted_scores[crit_id] = max(1.0, score - penalty)
                     reasoning_trace.append(f"Meta-Override Applied: Penalized {crit_id} by {penalty} due to low evidence stability ({avg_stability:.2f}).")
                 elif avg_stability == 1.0 and score >= 4.0:
-                    logger.info(f"  💎 SYSTEMIC CONFIDENCE: Boosting {crit_id} to 5.0 due to perfect evidence stability.")
+                    logger.info("  💎 SYSTEMIC CONFIDENCE: Boosting %s to 5.0 due to perfect evidence stability.", crit_id)
                     adjusted_scores[crit_id] = 5.0
                     reasoning_trace.append(f"Meta-Override Applied: Boosted {crit_id} to 5.0 due to 100% evidence stability across all runs.")
 
@@ -1,8 +1,12 @@
 """Meta-Audit Node for Automaton Auditor - Phase 5."""
 
+import hashlib
 import logging
 from typing import List, Dict, Any
 from collections import defaultdict
+
+import numpy as np
+from src.cache import meta_cache
 from src.state import MetaAuditState, AuditRun, EvidenceRecord, JudicialOpinion
 from src.nodes.justice import ChiefJusticeNode
 
@@ -21,6 +25,21 @@ class MetaAuditNode:
             logger.warning("⚠️ No runs found to aggregate.")
             return {}
 
+        # 0. Disk cache: identical run sets across CLI invocations collapse to
+        # a dict load (opt-in via the AUDITOR_META_CACHE env var)
+        cache_key = self._cache_key(state)
+        cached = meta_cache.get(cache_key)
+        if cached is not None:
+            logger.info("💾 MetaAudit: Cache hit for this run set; skipping consolidation.")
+            state.meta_registry = cached["meta_registry"]
+            state.meta_scores = cached["meta_scores"]
+            state.reasoning_trace.extend(cached["reasoning_trace"])
+            return {
+                "meta_registry": state.meta_registry,
+                "meta_scores": state.meta_scores,
+                "reasoning_trace": state.reasoning_trace
+            }
+
         # 1. Consolidate Evidence & Calculate Stability
         self._consolidate_evidence(state)
         
@@ -39,89 +58,137 @@ class MetaAuditNode:
         
         # 4. Final Metatrace
         state.reasoning_trace.append(f"Meta-Audit complete across {len(state.runs)} runs.")
-        
+
+        meta_cache.put(cache_key, {
+            "meta_registry": state.meta_registry,
+            "meta_scores": state.meta_scores,
+            "reasoning_trace": state.reasoning_trace,
+        })
+
         return {
             "meta_registry": state.meta_registry,
             "meta_scores": state.meta_scores,
             "reasoning_trace": state.reasoning_trace
         }
 
+    @staticmethod
+    def _cache_key(state: MetaAuditState) -> str:
+        """Stable digest of the run set: ids, scores and registry sizes."""
+        fingerprint = "|".join(
+            f"{run.run_id}:{run.overall_score}:{len(run.registry_state)}"
+            for run in sorted(state.runs, key=lambda r: r.run_id)
+        )
+        return hashlib.sha1(f"{state.repo_url}|{fingerprint}".encode()).hexdigest()
+
     def _consolidate_evidence(self, state: MetaAuditState):
         """Build MetaEvidenceRegistry and calculate stability scores."""
-        evidence_counts = defaultdict(int)
-        all_evidence: Dict[str, EvidenceRecord] = {}
-        
+        # Aggregate with one plain dict of (first_record, seen_run_ids);
+        # Pydantic copy/validation happens exactly once per unique key
+        # instead of once per sighting
+        agg: Dict[str, tuple] = {}
+
         num_runs = len(state.runs)
-        
+
         for run in state.runs:
+            run_id = run.run_id
             for ev_id, record in run.registry_state.items():
                 # We identify "same" evidence by artifact_path and claim_reference
                 # since IDs might change across runs if uuid is used.
                 # However, for now we assume consistent IDs if seeded correctly.
                 key = f"{record.artifact_path}:{record.claim_reference}"
-                evidence_counts[key] += 1
-                
-                if key not in all_evidence:
-                    all_evidence[key] = record.model_copy()
-                    all_evidence[key].seen_in_runs = []
-                
-                all_evidence[key].seen_in_runs.append(run.run_id)
-
-        # Calculate stability scores
-        for key, record in all_evidence.items():
-            record.stability_score = evidence_counts[key] / num_runs
-            state.meta_registry[key] = record
-            
-            if record.stability_score < 0.6:
-                logger.warning(f"  ⚠️ Transient Evidence Detected: {record.claim_reference} (Stability: {record.stability_score})")
-                state.reasoning_trace.append(f"Flagged transient evidence: {record.claim_reference} ({record.stability_score})")
+                entry = agg.get(key)
+                if entry is not None:
+                    entry[1].append(run_id)
+                else:
+                    agg[key] = (record, [run_id])
+
+        # One materialization pass: copy, stamp stability, register
+        for key, (record, runs_seen) in agg.items():
+            stability = len(runs_seen) / num_runs
+            meta_record = record.model_copy(
+                update={"seen_in_runs": runs_seen, "stability_score": stability}
+            )
+            state.meta_registry[key] = meta_record
+
+            if stability < 0.6:
+                logger.warning("  ⚠️ Transient Evidence Detected: %s (Stability: %s)", meta_record.claim_reference, stability)
+                state.reasoning_trace.append(f"Flagged transient evidence: {meta_record.claim_reference} ({stability})")
 
     def _detect_cross_run_contradictions(self, state: MetaAuditState):
         """Detect jump in scores or disappearing evidence across runs."""
         judge_scores = defaultdict(lambda: defaultdict(list)) # judge -> criterion -> scores
-        
+
         for run in state.runs:
             for opinion in run.opinions:
                 judge_scores[opinion.judge][opinion.criterion_id].append(opinion.score)
 
+        # Flatten (judge, criterion) score lists into one buffer and reduce
+        # max/min per group in NumPy; Python only touches offending cells
+        cells: List[tuple] = []
+        flat_scores: List[int] = []
+        offsets = [0]
         for judge, criteria in judge_scores.items():
             for criterion_id, scores in criteria.items():
                 if not scores: continue
-                
-                max_score = max(scores)
-                min_score = min(scores)
-                variance = max_score - min_score
-                
-                if variance > 1.5:
-                    msg = f"CRITICAL: {judge} score jump (Δ{variance}) for {criterion_id} across runs."
-                    logger.error(f"  ❌ {msg}")
-                    state.reasoning_trace.append(msg)
+                cells.append((judge, criterion_id))
+                flat_scores.extend(scores)
+                offsets.append(len(flat_scores))
+
+        if not cells:
+            return
+
+        scores_arr = np.asarray(flat_scores, dtype=np.int32)
+        offsets_arr = np.asarray(offsets, dtype=np.int64)
+        maxima = np.maximum.reduceat(scores_arr, offsets_arr[:-1])
+        minima = np.minimum.reduceat(scores_arr, offsets_arr[:-1])
+        variances = maxima - minima
+
+        for cell_idx in np.flatnonzero(variances > 1.5):
+            judge, criterion_id = cells[cell_idx]
+            msg = f"CRITICAL: {judge} score jump (Δ{variances[cell_idx]}) for {criterion_id} across runs."
+            logger.error("  ❌ %s", msg)
+            state.reasoning_trace.append(msg)
 
     def _normalize_consensus_scores(self, state: MetaAuditState):
         """Compute weighted meta-scores based on evidence stability."""
-        criterion_scores = defaultdict(list)
-        
+        # Column index per criterion, in first-seen order
+        crit_to_col: Dict[str, int] = {}
         for run in state.runs:
-            # Group scores by criterion
-            run_criterion_scores = defaultdict(list)
             for op in run.opinions:
-                run_criterion_scores[op.criterion_id].append(op.score)
-            
-            # Simple average for this run's criterion (could use Chief Justice logic here)
-            for crit_id, scores in run_criterion_scores.items():
-                run_avg = sum(scores) / len(scores)
-                criterion_scores[crit_id].append(run_avg)
-
-        # Final meta-normalization
-        for crit_id, meta_scores in criterion_scores.items():
-            # Apply stability weighting
-            # If evidence for this criterion is unstable, we penalize the meta-score
-            stability_buffer = self._get_criterion_stability(state, crit_id)
-            
-            raw_meta_score = sum(meta_scores) / len(meta_scores)
-            final_normalized = raw_meta_score * stability_buffer
-            
-            state.meta_scores[crit_id] = round(final_normalized, 2)
+                if op.criterion_id not in crit_to_col:
+                    crit_to_col[op.criterion_id] = len(crit_to_col)
+
+        if not crit_to_col:
+            return
+
+        # (runs x criteria) score sums and counts, reduced in NumPy instead
+        # of nested defaultdict(list) + per-list sum()/len() in the interpreter
+        n_runs = len(state.runs)
+        n_crit = len(crit_to_col)
+        sums = np.zeros((n_runs, n_crit), dtype=np.float64)
+        counts = np.zeros((n_runs, n_crit), dtype=np.float64)
+        for r, run in enumerate(state.runs):
+            for op in run.opinions:
+                c = crit_to_col[op.criterion_id]
+                sums[r, c] += op.score
+                counts[r, c] += 1
+
+        # Per-run criterion averages; NaN marks criteria absent from a run so
+        # nanmean matches the old "average only over runs that scored it"
+        with np.errstate(invalid="ignore"):
+            run_avgs = sums / counts
+            raw_meta_scores = np.nanmean(run_avgs, axis=0)
+
+        # Apply stability weighting
+        # If evidence for this criterion is unstable, we penalize the meta-score
+        stability_buffers = np.fromiter(
+            (self._get_criterion_stability(state, crit_id) for crit_id in crit_to_col),
+            dtype=np.float64, count=n_crit,
+        )
+        final_normalized = np.round(raw_meta_scores * stability_buffers, 2)
+
+        for crit_id, final_score, stability_buffer in zip(crit_to_col, final_normalized, stability_buffers):
+            state.meta_scores[crit_id] = float(final_score)
             state.reasoning_trace.append(f"Meta-score for {crit_id}: {state.meta_scores[crit_id]} (Stability: {stability_buffer})")
 
     def _get_criterion_stability(self, state: MetaAuditState, criterion_id: str) -> float:
@@ -61,4 +61,16 @@ Scoring Guidelines:
 3 = Junior/Senior level work. Works, but nothing special.
 5 = Master Thinker. Architecturally sound, modular, and safe.
 
-Remember: You are the TECH LEAD. Your reputation is on the line. Only reward what works."""
\ No newline at end of file
+Remember: You are the TECH LEAD. Your reputation is on the line. Only reward what works."""
+
+# Canonical persona registry - keyed by the judge literal used in
+# JudicialOpinion. Prefer PROMPTS[...] over the bare module constants.
+PROMPTS: dict[str, str] = {
+    "Prosecutor": PROSECUTOR_PROMPT,
+    "Defense": DEFENSE_PROMPT,
+    "TechLead": TECH_LEAD_PROMPT,
+}
+
+# Rough token counts (~4 chars/token) for LLM-call budgeting, computed once
+# at import instead of per request.
+PROMPT_TOKEN_ESTIMATES: dict[str, int] = {k: len(v) // 4 for k, v in PROMPTS.items()}
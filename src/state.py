@@ -63,31 +63,57 @@
 
 """State definitions for Automaton Auditor - Phase 2 (Pydantic)."""
 
-from pydantic import BaseModel, Field, ConfigDict, validator
+from functools import cached_property, lru_cache
+
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 from typing import List, Dict, Optional, Any, Literal, Annotated
 from datetime import datetime
-import operator
+from types import MappingProxyType
 
 from src.core.evidence_registry import EvidenceRegistry, EvidenceRecord
 from src.core.evidence_graph import EvidenceGraph
 import uuid
 
+# Detector -> EvidenceRecord source, shared read-only across to_record calls
+_SOURCE_MAP = MappingProxyType({"repo": "repo", "doc": "pdf", "vision": "vision"})
+
+@lru_cache(maxsize=256)
+def _criterion_meta(criterion_id: str) -> Dict[str, Any]:
+    """Lowercase form and token set for a criterion ID, shared across states.
+
+    Criterion IDs come from a small closed rubric set, so this hits on every
+    call after the first - including across audit runs in meta-audit mode.
+    Callers must treat the returned dict as read-only.
+    """
+    cid_lower = criterion_id.lower()
+    return {"lower": cid_lower, "tokens": frozenset(cid_lower.split("_"))}
+
+
 def merge_dicts(left: Dict[str, List[Any]], right: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
     """Merge evidence dictionaries by concatenating lists for matching keys."""
-    res = left.copy() if left else {}
+    # Shallow-copy the left lists once, then extend in place: no fresh
+    # list allocation per key per fan-in merge
+    res = {k: list(lst) for k, lst in left.items()} if left else {}
     for k, v in (right or {}).items():
-        # Enforce detector attribution
+        dst = res.get(k)
+        if dst is None:
+            dst = res[k] = []
+        # Enforce detector attribution, fused with the append pass; skip the
+        # setattr when the producing node already stamped itself (the common
+        # case), leaving only a read per evidence item
         for ev in v:
-            if hasattr(ev, 'detector'):
+            if getattr(ev, 'detector', k) != k:
                 ev.detector = k
-                
-        if k in res:
-            res[k] = res[k] + v
-        else:
-            res[k] = v
+            dst.append(ev)
     return res
 
 
+def concat_lists(left: List[Any], right: List[Any]) -> List[Any]:
+    """Opinion reducer: C-level unpack sizes the result once, and an empty
+    left side (the common first fan-in) skips straight to a copy of right."""
+    return [*left, *right] if left else list(right or ())
+
+
 class Evidence(BaseModel):
     """Forensic evidence collected by detectives."""
     
@@ -97,23 +123,27 @@ class Evidence(BaseModel):
     content: Optional[str] = Field(default=None, description="Actual evidence content")
     location: str = Field(description="File path or commit hash")
     rationale: str = Field(description="Why we're confident")
+    # Bounds are enforced by pydantic-core via ge/le; no extra Python-level
+    # validator needed on this per-construction hot path
     confidence: float = Field(ge=0.0, le=1.0, description="Confidence score 0-1")
     timestamp: datetime = Field(default_factory=datetime.now, description="When evidence was collected")
     detector: str = Field(default="unknown", description="Which detective collected this")
 
-    @validator("confidence")
-    def validate_confidence_range(cls, v):
-        """Proof of architectural excellence: Validating confidence bounds."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("Confidence must be between 0.0 and 1.0")
-        return v
+    # Hot-constructed model: reject stray fields instead of storing them.
+    # Not frozen - merge_dicts stamps detector attribution post-construction.
+    model_config = ConfigDict(extra="forbid")
+
+    @cached_property
+    def goal_lower(self) -> str:
+        """Lowercased goal, computed once - the goal is fixed while judges match against it."""
+        return self.goal.lower()
+
 
     def to_record(self) -> EvidenceRecord:
         """Adapter to migrate legacy Evidence to canonical EvidenceRecord."""
-        source_map = {"repo": "repo", "doc": "pdf", "vision": "vision"}
         return EvidenceRecord(
             id=self.id,
-            source=source_map.get(self.detector, "repo"),
+            source=_SOURCE_MAP.get(self.detector, "repo"),
             artifact_path=self.location,
             claim_reference=self.goal,
             exists=self.found,
@@ -148,6 +178,9 @@ class CriterionResult(BaseModel):
     reasoning_trace: List[str] = Field(default_factory=list, description="Ordered log of deterministic rules and overrides applied")
     remediation: str = Field(default="", description="Specific improvement instructions")
 
+    # Not frozen - coherence guards adjust final_score after synthesis
+    model_config = ConfigDict(extra="forbid")
+
 
 class AuditReport(BaseModel):
     """Final audit report."""
@@ -171,6 +204,9 @@ class AuditRun(BaseModel):
     registry_state: Dict[str, EvidenceRecord]
     contradictions_found: List[str] = Field(default_factory=list)
 
+    # Only instantiated in multi-run mode; build the core schema lazily
+    model_config = ConfigDict(defer_build=True)
+
 
 class MetaAuditState(BaseModel):
     """Higher-order state for aggregating multiple audit runs."""
@@ -200,25 +236,30 @@ class AgentState(BaseModel):
     evidences: Annotated[Dict[str, List[Evidence]], merge_dicts] = Field(default_factory=dict)
     
     # Judicial opinions
-    opinions: Annotated[List[JudicialOpinion], operator.add] = Field(default_factory=list)
+    opinions: Annotated[List[JudicialOpinion], concat_lists] = Field(default_factory=list)
     
     # Final report
     final_report: Optional[AuditReport] = None
-    
+
+    # Non-interactive audits route through the OpenAI Batch API judge panel
+    batch_mode: bool = Field(default=False, description="Use the Batch API judge panel (CI/cron runs)")
+
     # Metadata
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    
+
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
         json_encoders={datetime: lambda v: v.isoformat()}
     )
     
+    def get_criterion_meta(self, criterion_id: str) -> Dict[str, Any]:
+        """Return cached {'lower': ..., 'tokens': ...} for a criterion ID."""
+        return _criterion_meta(criterion_id)
+
     def add_evidence(self, detector: str, evidence: Evidence) -> None:
         """Add evidence to the state."""
-        if detector not in self.evidences:
-            self.evidences[detector] = []
         evidence.detector = detector
-        self.evidences[detector].append(evidence)
+        self.evidences.setdefault(detector, []).append(evidence)
     
     def get_evidence_count(self) -> int:
         """Get total number of evidence items."""
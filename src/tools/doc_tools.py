@@ -1,55 +1,250 @@
 """Document forensic tools - Improved with OCR awareness."""
 
+import mmap
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from pydantic import TypeAdapter
+
 from src.state import Evidence
 import logging
 logger = logging.getLogger(__name__)
 
-# Try to import PDF libraries
+# Optional multi-pattern matcher: one scan over the text instead of one
+# substring probe per signal (same convention as the justice node)
 try:
-    import pypdf
-    PYPDF_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    PYPDF_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
 
-try:
-    import fitz  # PyMuPDF
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    PYMUPDF_AVAILABLE = False
+# Source-file path references inside report text (compiled once at import)
+_PATH_RE = re.compile(r'src/[\w/]+\.py')
 
-# Optional OCR support
-try:
-    import pytesseract
-    from pdf2image import convert_from_path
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
+# Schema resolved once; validated construction batch-runs in pydantic-core
+# over the whole evidence list instead of one model call per item
+_EV_LIST_ADAPTER = TypeAdapter(List[Evidence])
+
+# PHASE 3: Semantic Clusters (Architecture & Governance)
+SEMANTIC_CLUSTERS = {
+    "Architectural Depth": [
+        "dialectical", "state synchronization", "orchestration",
+        "graph swarm", "parallel execution", "metacognition",
+        "fan-in", "fan-out"
+    ],
+    "Autonomous Governance": [
+        "arbitration", "justice", "nuance", "dissent",
+        "forensic", "compliance", "audit", "governance",
+        "reasoning trace"
+    ],
+    "Technical Sophistication": [
+        "pydantic", "langgraph", "structured output",
+        "basemodel", "typeddict", "detector", "visioninspector"
+    ]
+}
+
+
+# (cluster, signal, lowercase signal) triples computed once at import; the
+# fallback probe loop must not re-lower each keyword per call
+_SIGNAL_TRIPLES = tuple(
+    (cluster_name, signal, signal.lower())
+    for cluster_name, signals in SEMANTIC_CLUSTERS.items()
+    for signal in signals
+)
+
+
+def _build_signal_automaton():
+    """Compile every cluster signal into one Aho-Corasick automaton, or None without the dependency."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for cluster_name, signal, signal_lower in _SIGNAL_TRIPLES:
+        automaton.add_word(signal_lower, (cluster_name, signal))
+    automaton.make_automaton()
+    return automaton
+
+
+_SIGNAL_AUTOMATON = _build_signal_automaton()
+
+# Heavy PDF/OCR backends load lazily: availability is probed from package
+# metadata here (cheap), the real imports happen on first use so code paths
+# that never open a PDF skip the multi-hundred-ms import cost entirely
+from importlib import util as _importlib_util
+
+PYPDF_AVAILABLE = _importlib_util.find_spec("pypdf") is not None
+PYMUPDF_AVAILABLE = _importlib_util.find_spec("fitz") is not None  # PyMuPDF
+OCR_AVAILABLE = (
+    _importlib_util.find_spec("pytesseract") is not None
+    and _importlib_util.find_spec("pdf2image") is not None
+)
+
+pypdf = None
+fitz = None
+pytesseract = None
+convert_from_path = None
+
+
+def _load_pdf_backends() -> None:
+    """Import whichever PDF/OCR backends are available, once, on first use."""
+    global pypdf, fitz, pytesseract, convert_from_path
+    if PYMUPDF_AVAILABLE and fitz is None:
+        import fitz as _fitz
+        fitz = _fitz
+    if PYPDF_AVAILABLE and pypdf is None:
+        import pypdf as _pypdf
+        pypdf = _pypdf
+    if OCR_AVAILABLE and pytesseract is None:
+        import pytesseract as _pytesseract
+        from pdf2image import convert_from_path as _convert_from_path
+        pytesseract, convert_from_path = _pytesseract, _convert_from_path
+
+
+# At or above this page count, per-page extraction fans out to a process
+# pool; shorter documents stay serial since fork overhead dominates
+_PARALLEL_PAGE_THRESHOLD = 16
+
+# Stripped-text length above which a document counts as text-based
+_HAS_TEXT_THRESHOLD = 100
 
 
-def analyze_pdf_intelligently(pdf_path: str) -> Dict[str, any]:
+def _scan_text_chunk(text: str, hits_by_cluster: Dict[str, set], paths: List[str]) -> None:
+    """Fused scan of one text chunk: bucket cluster signal hits and collect
+    file-path references while the chunk is hot, so callers never need the
+    whole document concatenated into one string."""
+    text_lower = text.lower()
+    if _SIGNAL_AUTOMATON is not None:
+        for _, (cluster_name, signal) in _SIGNAL_AUTOMATON.iter(text_lower):
+            hits_by_cluster[cluster_name].add(signal)
+    else:
+        for cluster_name, signal, signal_lower in _SIGNAL_TRIPLES:
+            if signal_lower in text_lower:
+                hits_by_cluster[cluster_name].add(signal)
+    paths.extend(_PATH_RE.findall(text))
+
+
+def _scan_until_text(pdf_path: str, page_count: int) -> tuple:
+    """Serial page walk that bails once the text threshold is crossed.
+
+    has_text / is_scanned are monotonic predicates, so the routing decision
+    is usually settled after the first couple of pages.
+    """
+    doc = fitz.open(pdf_path)
+    parts = []
+    images = 0
+    text_len = 0
+    try:
+        for page in doc:
+            # "text" flavor skips MuPDF's block/line structure build;
+            # flags=0 drops the preserve-ligatures/whitespace defaults (the
+            # keyword probes want plain expanded letters anyway) and
+            # full=False skips the inherited-xref walk per image
+            text = page.get_text("text", flags=0)
+            if text and text.strip():
+                parts.append(text)
+                text_len += len(text)
+            images += len(page.get_images(full=False))
+            if text_len > _HAS_TEXT_THRESHOLD:
+                break
+    finally:
+        doc.close()
+    return parts, images
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> tuple:
+    """Worker: streamed scan results for a contiguous page range.
+
+    Each call opens its own document handle - PyMuPDF is fork-safe but a
+    single handle cannot be shared across workers. Page text is scanned and
+    discarded page-by-page: only cluster hits, path references, text length
+    and image count cross the process boundary, never the text itself.
+    """
+    _load_pdf_backends()
+    doc = fitz.open(pdf_path)
+    hits_by_cluster = {name: set() for name in SEMANTIC_CLUSTERS}
+    paths: List[str] = []
+    text_len = 0
+    images = 0
+    try:
+        for page_num in range(start, end):
+            page = doc[page_num]
+            # Plain "text" flavor with flags=0 and full=False: no
+            # layout-dict, ligature/whitespace preservation or
+            # inherited-xref work per page
+            text = page.get_text("text", flags=0)
+            if text and text.strip():
+                text_len += len(text)
+                _scan_text_chunk(text, hits_by_cluster, paths)
+            images += len(page.get_images(full=False))
+    finally:
+        doc.close()
+    return hits_by_cluster, paths, text_len, images
+
+
+@dataclass(slots=True)
+class PdfAnalysis:
+    """Fixed-layout result of the document scan - attribute access instead
+    of per-key dict hashing in the report builder."""
+    has_text: bool = False
+    text_length: int = 0
+    has_images: bool = False
+    image_count: int = 0
+    page_count: int = 0
+    is_scanned: bool = False
+    needs_ocr: bool = False
+    extracted_text: str = ""
+    # Streamed scan results; None means the scan has not run and the report
+    # builder must fall back to scanning extracted_text itself
+    cluster_hits: Optional[Dict[str, set]] = None
+    path_refs: Optional[List[str]] = None
+
+
+def analyze_pdf_intelligently(pdf_path: str, quick_mode: bool = False, return_text: bool = True) -> PdfAnalysis:
     """
     Intelligently analyze PDF to determine:
     - Has extractable text?
     - Is it image-based?
     - Contains images?
     - Needs OCR?
+
+    Results are memoized by (path, mtime, size) - the PDF is immutable for
+    the duration of an audit, so repeat calls skip the full-document scan.
+
+    quick_mode answers only the routing question ("is this text-based?"):
+    the page walk stops as soon as the text threshold is crossed, so the
+    returned text/image figures are partial. Use it when the caller does not
+    need the full extracted text.
+
+    return_text=False drops extracted_text from the returned copy - for
+    callers that only route on document shape, this avoids handing them a
+    multi-megabyte str they would silently keep alive.
     """
-    result = {
-        "has_text": False,
-        "text_length": 0,
-        "has_images": False,
-        "image_count": 0,
-        "page_count": 0,
-        "is_scanned": False,
-        "needs_ocr": False,
-        "extracted_text": ""
-    }
-    
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return _analyze_pdf(pdf_path, quick_mode)
+    # Shallow copy: analyze_pdf_report mutates the result in place (OCR
+    # backfill), which must not poison the cache entry
+    analysis = _analyze_pdf_cached(pdf_path, st.st_mtime_ns, st.st_size, quick_mode)
+    if return_text:
+        return replace(analysis)
+    return replace(analysis, extracted_text="")
+
+
+@lru_cache(maxsize=32)
+def _analyze_pdf_cached(pdf_path: str, mtime_ns: int, size: int, quick: bool) -> PdfAnalysis:
+    return _analyze_pdf(pdf_path, quick)
+
+
+def _analyze_pdf(pdf_path: str, quick: bool = False) -> PdfAnalysis:
+    _load_pdf_backends()
+    result = PdfAnalysis()
+
     if not os.path.exists(pdf_path):
         return result
     
@@ -57,50 +252,75 @@ def analyze_pdf_intelligently(pdf_path: str) -> Dict[str, any]:
         # Use PyMuPDF for best analysis
         if PYMUPDF_AVAILABLE:
             doc = fitz.open(pdf_path)
-            result["page_count"] = len(doc)
-            
-            # Check for text and images on each page
-            total_text = ""
-            total_images = 0
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Extract text
-                text = page.get_text()
-                if text and text.strip():
-                    total_text += text + "\n"
-                
-                # Check for images
-                image_list = page.get_images()
-                total_images += len(image_list)
-            
-            result["has_text"] = len(total_text.strip()) > 100
-            result["text_length"] = len(total_text)
-            result["has_images"] = total_images > 0
-            result["image_count"] = total_images
-            result["extracted_text"] = total_text
-            
-            # Determine if scanned (has images but no text)
-            if total_images > 0 and not result["has_text"]:
-                result["is_scanned"] = True
-                result["needs_ocr"] = OCR_AVAILABLE
-            
+            page_count = len(doc)
+            result.page_count = page_count
             doc.close()
+
+            # Page extraction is CPU-bound and per-page independent: long
+            # documents split into contiguous ranges across a process pool.
+            # Quick mode stays serial - its whole point is to stop early.
+            if quick:
+                parts, total_images = _scan_until_text(pdf_path, page_count)
+                total_text = "\n".join(parts) + "\n" if parts else ""
+                result.has_text = len(total_text.strip()) > _HAS_TEXT_THRESHOLD
+                result.text_length = len(total_text)
+                result.extracted_text = total_text
+            else:
+                # Full analysis streams: each page is scanned for cluster
+                # signals and path references as it is extracted, then its
+                # text is dropped - peak memory stays O(one page), not
+                # O(document), and parallel workers ship only aggregates
+                if page_count >= _PARALLEL_PAGE_THRESHOLD:
+                    # Capped at 4: beyond that, fork + per-worker document
+                    # open overhead eats the gain on typical report sizes
+                    workers = min(os.cpu_count() or 1, 4, page_count)
+                    chunk = -(-page_count // workers)  # ceil division
+                    ranges = [
+                        (pdf_path, start, min(start + chunk, page_count))
+                        for start in range(0, page_count, chunk)
+                    ]
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        chunk_results = list(pool.map(_extract_page_range, *zip(*ranges)))
+                    hits_by_cluster = {name: set() for name in SEMANTIC_CLUSTERS}
+                    paths: List[str] = []
+                    text_len = 0
+                    total_images = 0
+                    for chunk_hits, chunk_paths, chunk_len, chunk_images in chunk_results:
+                        for name, found in chunk_hits.items():
+                            hits_by_cluster[name] |= found
+                        paths.extend(chunk_paths)
+                        text_len += chunk_len
+                        total_images += chunk_images
+                else:
+                    hits_by_cluster, paths, text_len, total_images = _extract_page_range(pdf_path, 0, page_count)
+
+                result.has_text = text_len > _HAS_TEXT_THRESHOLD
+                result.text_length = text_len
+                result.cluster_hits = hits_by_cluster
+                result.path_refs = paths
+
+            result.has_images = total_images > 0
+            result.image_count = total_images
+
+            # Determine if scanned (has images but no text)
+            if total_images > 0 and not result.has_text:
+                result.is_scanned = True
+                result.needs_ocr = OCR_AVAILABLE
             
-        # Fallback to pypdf
+        # Fallback to pypdf: memory-map the file so pypdf's many small
+        # seeks/reads are served straight from the page cache, with no
+        # userspace copy of the whole document
         elif PYPDF_AVAILABLE:
-            reader = pypdf.PdfReader(pdf_path)
-            result["page_count"] = len(reader.pages)
-            
-            total_text = ""
-            for page in reader.pages:
-                text = page.extract_text() or ""
-                total_text += text
-            
-            result["has_text"] = len(total_text.strip()) > 100
-            result["text_length"] = len(total_text)
-            result["extracted_text"] = total_text
+            with open(pdf_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                reader = pypdf.PdfReader(mm)
+                result.page_count = len(reader.pages)
+
+                total_text = "".join(page.extract_text() or "" for page in reader.pages)
+
+            result.has_text = len(total_text.strip()) > _HAS_TEXT_THRESHOLD
+            result.text_length = len(total_text)
+            result.extracted_text = total_text
     
     except Exception as e:
         logger.error(f"⚠️ PDF analysis error: {e}")
@@ -108,98 +328,136 @@ def analyze_pdf_intelligently(pdf_path: str) -> Dict[str, any]:
     return result
 
 
+def _ocr_one(img) -> str:
+    """OCR a single page image; runs inside pool workers, so imports locally.
+
+    Binarizing (grayscale, autocontrast, hard threshold) before Tesseract
+    both speeds convergence and improves accuracy on scanned report pages;
+    --oem 1 selects the LSTM engine only and --psm 6 assumes one uniform
+    text block, which matches report layouts.
+    """
+    import pytesseract
+    from PIL import ImageOps
+
+    img = ImageOps.autocontrast(img.convert('L'))
+    img = img.point(lambda p: 255 if p > 150 else 0)
+    return pytesseract.image_to_string(img, config='--oem 1 --psm 6')
+
+
 def extract_text_with_ocr(pdf_path: str) -> str:
     """Extract text using OCR for scanned PDFs."""
     if not OCR_AVAILABLE:
         return "OCR not available"
-    
+
+    _load_pdf_backends()
     try:
-        images = convert_from_path(pdf_path)
-        text = ""
-        for img in images:
-            text += pytesseract.image_to_string(img) + "\n"
-        return text
+        workers = os.cpu_count() or 1
+        # Poppler rasterizes pages in parallel; Tesseract is single-threaded
+        # per call, so multi-page OCR fans out across a process pool.
+        # 200 dpi halves the pixel count of the 300 dpi default while staying
+        # comfortably above what Tesseract needs for body text.
+        images = convert_from_path(pdf_path, dpi=200, thread_count=workers)
+        if len(images) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(images))) as pool:
+                texts = list(pool.map(_ocr_one, images))
+        else:
+            texts = [_ocr_one(img) for img in images]
+        return "".join(text + "\n" for text in texts)
     except Exception as e:
         return f"OCR failed: {str(e)}"
 
 
-def analyze_pdf_report(pdf_path: str) -> List[Evidence]:
+def analyze_pdf_report(pdf_path: str, validate: bool = False) -> List[Evidence]:
     """
     Main function to analyze PDF and return evidence list.
     Now with intelligent PDF type detection.
+
+    All Evidence fields are built by this module from trusted values, so by
+    default models are assembled with model_construct (no pydantic-core
+    validation pass); validate=True instead collects plain dicts and batch-
+    validates them through a cached TypeAdapter in one pydantic-core call.
     """
     evidences = []
+    _evidence = dict if validate else Evidence.model_construct
+    # One clock read per report - every evidence item shares it, instead of a
+    # datetime.now() syscall inside each default factory
+    ts = datetime.now()
     
     try:
         # First, intelligently analyze PDF
         analysis = analyze_pdf_intelligently(pdf_path)
         
         # Evidence 1: Document accessibility
-        if analysis["has_text"]:
-            accessible_evidence = Evidence(
+        if analysis.has_text:
+            accessible_evidence = _evidence(
                 goal="Document Access",
                 found=True,
-                content=f"Extracted {analysis['text_length']} characters from {analysis['page_count']} pages",
+                content=f"Extracted {analysis.text_length} characters from {analysis.page_count} pages",
                 location=pdf_path,
                 rationale="Successfully extracted text from PDF",
-                confidence=0.9
+                confidence=0.9,
+                timestamp=ts
             )
-        elif analysis["is_scanned"]:
-            accessible_evidence = Evidence(
+        elif analysis.is_scanned:
+            accessible_evidence = _evidence(
                 goal="Document Access",
                 found=False,
-                content=f"PDF appears to be scanned/image-based with {analysis['image_count']} images. OCR required.",
+                content=f"PDF appears to be scanned/image-based with {analysis.image_count} images. OCR required.",
                 location=pdf_path,
                 rationale="PDF contains images but no extractable text - may need OCR",
-                confidence=0.7
+                confidence=0.7,
+                timestamp=ts
             )
             
             # Try OCR if available
             if OCR_AVAILABLE:
                 ocr_text = extract_text_with_ocr(pdf_path)
                 if len(ocr_text) > 100:
-                    analysis["extracted_text"] = ocr_text
-                    analysis["has_text"] = True
+                    # Scan the OCR output immediately instead of retaining it
+                    hits = {name: set() for name in SEMANTIC_CLUSTERS}
+                    ocr_paths: List[str] = []
+                    _scan_text_chunk(ocr_text, hits, ocr_paths)
+                    analysis.cluster_hits = hits
+                    analysis.path_refs = ocr_paths
+                    analysis.text_length = len(ocr_text)
+                    analysis.has_text = True
                     
         else:
-            accessible_evidence = Evidence(
+            accessible_evidence = _evidence(
                 goal="Document Access",
                 found=False,
                 content="No extractable text found in PDF",
                 location=pdf_path,
                 rationale="PDF may be empty, corrupted, or have no text layer",
-                confidence=0.3
+                confidence=0.3,
+                timestamp=ts
             )
         
         evidences.append(accessible_evidence)
         
-        # Evidence 2: Theoretical depth (if we have text)
-        if analysis["has_text"] and analysis["extracted_text"]:
-            text = analysis["extracted_text"]
-            
-            # PHASE 3: Semantic Clusters (Architecture & Governance)
-            clusters = {
-                "Architectural Depth": [
-                    "dialectical", "state synchronization", "orchestration", 
-                    "graph swarm", "parallel execution", "metacognition",
-                    "fan-in", "fan-out"
-                ],
-                "Autonomous Governance": [
-                    "arbitration", "justice", "nuance", "dissent", 
-                    "forensic", "compliance", "audit", "governance", 
-                    "reasoning trace"
-                ],
-                "Technical Sophistication": [
-                    "pydantic", "langgraph", "structured output", 
-                    "basemodel", "typeddict", "detector", "visioninspector"
-                ]
-            }
-            
+        # Evidence 2: Theoretical depth. The PyMuPDF path streams cluster
+        # hits and path references page-by-page during extraction; only the
+        # pypdf fallback (and quick mode) still hands back one concatenated
+        # string, scanned here and released
+        if analysis.cluster_hits is None and analysis.extracted_text:
+            hits = {name: set() for name in SEMANTIC_CLUSTERS}
+            flat_paths: List[str] = []
+            _scan_text_chunk(analysis.extracted_text, hits, flat_paths)
+            analysis.cluster_hits = hits
+            analysis.path_refs = flat_paths
+            analysis.extracted_text = ""
+
+        # Gate on has_text, as baseline did: documents with only trace text
+        # (under the threshold) belong in the no-text branch below, and the
+        # OCR backfill sets has_text itself when it succeeds
+        if analysis.has_text and analysis.cluster_hits is not None:
+            hits_by_cluster = analysis.cluster_hits
+
             cluster_results = {}
             total_active_signals = 0
-            
-            for cluster_name, signals in clusters.items():
-                found_in_cluster = [s for s in signals if s.lower() in text.lower()]
+
+            for cluster_name in SEMANTIC_CLUSTERS:
+                found_in_cluster = hits_by_cluster[cluster_name]
                 # Cluster activates only if >= 3 signals found
                 is_active = len(found_in_cluster) >= 3
                 cluster_results[cluster_name] = {
@@ -212,75 +470,82 @@ def analyze_pdf_report(pdf_path: str) -> List[Evidence]:
             # Theoretical Depth Score based on active clusters
             active_cluster_names = [name for name, res in cluster_results.items() if res["active"]]
             
-            keyword_evidence = Evidence(
+            keyword_evidence = _evidence(
                 goal="Theoretical Depth",
                 found=len(active_cluster_names) > 0,
                 content=f"Active Clusters: {', '.join(active_cluster_names)} | Signals: {total_active_signals}",
                 location=pdf_path,
                 rationale=f"Found {len(active_cluster_names)} active semantic clusters. Active themes: {', '.join(active_cluster_names[:2])}.",
-                confidence=min(1.0, 0.4 + (len(active_cluster_names) * 0.2)) if active_cluster_names else 0.2
+                confidence=min(1.0, 0.4 + (len(active_cluster_names) * 0.2)) if active_cluster_names else 0.2,
+                timestamp=ts
             )
             evidences.append(keyword_evidence)
             
-            # Extract file paths
-            paths = re.findall(r'src/[\w/]+\.py', text)
-            paths_evidence = Evidence(
+            paths = analysis.path_refs or []
+            paths_evidence = _evidence(
                 goal="Report File References",
                 found=len(paths) > 0,
                 content="\n".join(paths[:5]) if paths else None,
                 location=pdf_path,
                 rationale=f"Found {len(paths)} file path references",
-                confidence=0.8 if paths else 0.2
+                confidence=0.8 if paths else 0.2,
+                timestamp=ts
             )
             evidences.append(paths_evidence)
-            
+
         else:
             # No text - explain why
-            if analysis["is_scanned"]:
+            if analysis.is_scanned:
                 reason = "PDF appears to be scanned/image-based"
             else:
                 reason = "No extractable text content"
             
-            no_text_evidence = Evidence(
+            no_text_evidence = _evidence(
                 goal="Theoretical Depth",
                 found=False,
                 content=reason,
                 location=pdf_path,
                 rationale=f"Cannot analyze keywords: {reason}",
-                confidence=0.4
+                confidence=0.4,
+                timestamp=ts
             )
             evidences.append(no_text_evidence)
             
-            no_paths_evidence = Evidence(
+            no_paths_evidence = _evidence(
                 goal="Report File References",
                 found=False,
                 content=reason,
                 location=pdf_path,
                 rationale=f"Cannot extract file paths: {reason}",
-                confidence=0.3
+                confidence=0.3,
+                timestamp=ts
             )
             evidences.append(no_paths_evidence)
         
         # Evidence about PDF type (new)
-        pdf_type_evidence = Evidence(
+        pdf_type_evidence = _evidence(
             goal="PDF Type Analysis",
             found=True,
-            content=f"Pages: {analysis['page_count']}, Has text: {analysis['has_text']}, Has images: {analysis['has_images']}, Scanned: {analysis['is_scanned']}",
+            content=f"Pages: {analysis.page_count}, Has text: {analysis.has_text}, Has images: {analysis.has_images}, Scanned: {analysis.is_scanned}",
             location=pdf_path,
-            rationale=f"PDF contains {analysis['page_count']} pages, {'text' if analysis['has_text'] else 'no text'}, {analysis['image_count']} images",
-            confidence=0.9
+            rationale=f"PDF contains {analysis.page_count} pages, {'text' if analysis.has_text else 'no text'}, {analysis.image_count} images",
+            confidence=0.9,
+            timestamp=ts
         )
         evidences.append(pdf_type_evidence)
         
     except Exception as e:
-        error_evidence = Evidence(
+        error_evidence = _evidence(
             goal="Document Analysis",
             found=False,
             content=str(e),
             location=pdf_path,
             rationale=f"Failed to analyze PDF: {type(e).__name__}",
-            confidence=0.0
+            confidence=0.0,
+            timestamp=ts
         )
         evidences.append(error_evidence)
-    
+
+    if validate:
+        return _EV_LIST_ADAPTER.validate_python(evidences)
     return evidences
\ No newline at end of file
@@ -4,7 +4,10 @@ import tempfile
 import subprocess
 import os
 import ast
+import mmap
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Union
 from datetime import datetime
@@ -13,19 +16,81 @@ from src.state import Evidence
 import logging
 logger = logging.getLogger(__name__)
 
+# Optional: libgit2 bindings make history walks an in-process call instead
+# of a subprocess spawn plus stdout parsing
+try:
+    import pygit2
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
+
+# Everything the detectors actually open: Python sources plus the handful of
+# marker files the license/CI probes look for. Large binary assets (models,
+# images, PDFs) fall outside these patterns and are never fetched.
+_SPARSE_PATTERNS = (
+    "*.py", "src/", "tests/",
+    "LICENSE*", "COPYING",
+    ".github/", ".gitlab-ci.yml", "Jenkinsfile", ".travis.yml", ".circleci/",
+)
+
+
+def _try_sparse_clone(repo_url: str, temp_dir: str, env: Dict[str, str]) -> bool:
+    """Blobless sparse clone of the analyzed paths; False means the server
+    (or local git) rejected partial clone and the caller should fall back.
+
+    sparse-checkout materializes every matching blob in one batched fetch,
+    so the scanners still read plain local files afterwards.
+    """
+    result = subprocess.run(
+        ["git", "clone", "--depth", "1", "--single-branch", "--no-tags",
+         "--filter=blob:none", "--sparse", repo_url, temp_dir],
+        capture_output=True, text=True, timeout=1200, env=env,
+    )
+    if result.returncode != 0:
+        return False
+    sparse = subprocess.run(
+        ["git", "-C", temp_dir, "sparse-checkout", "set", "--no-cone", *_SPARSE_PATTERNS],
+        capture_output=True, text=True, timeout=600, env=env,
+    )
+    if sparse.returncode == 0:
+        return True
+    # Patterns rejected: materialize the full tree rather than hand the
+    # detectives a partial checkout
+    full = subprocess.run(
+        ["git", "-C", temp_dir, "sparse-checkout", "disable"],
+        capture_output=True, text=True, timeout=600, env=env,
+    )
+    return full.returncode == 0
+
 
 def clone_repository_sandboxed(repo_url: str, full_history: bool = False) -> Union[str, None]:
     """Safely clone a git repository to a temporary directory."""
     temp_dir = tempfile.mkdtemp(prefix="repo_audit_")
     try:
         logger.info(f"📥 Cloning {repo_url}...")
-        clone_cmd = ["git", "clone"]
+        # Fail fast on private/bad URLs instead of hanging on an auth prompt
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+        # Shallow audits try a blobless sparse clone first - only the paths
+        # the detectors read come over the wire. History audits need every
+        # commit, so they take the plain clone below.
+        if not full_history:
+            if _try_sparse_clone(repo_url, temp_dir, env):
+                return temp_dir
+            logger.warning("⚠️ Partial clone unsupported; falling back to plain shallow clone.")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            temp_dir = tempfile.mkdtemp(prefix="repo_audit_")
+
+        # --single-branch/--no-tags: we only audit HEAD of the default branch,
+        # so skip fetching other refs entirely
+        clone_cmd = ["git", "clone", "--single-branch", "--no-tags"]
         if not full_history:
             clone_cmd.extend(["--depth", "1"])
         clone_cmd.extend([repo_url, temp_dir])
-        
-        result = subprocess.run(clone_cmd, capture_output=True, text=True, timeout=1200)
-        
+
+        result = subprocess.run(clone_cmd, capture_output=True, text=True, timeout=1200, env=env)
+
         if result.returncode != 0:
             logger.error(f"❌ Clone failed: {result.stderr[:200]}")
             shutil.rmtree(temp_dir, ignore_errors=True)
@@ -39,41 +104,125 @@ def clone_repository_sandboxed(repo_url: str, full_history: bool = False) -> Uni
 
 def get_git_history(repo_path: str) -> List[Dict[str, str]]:
     """Get commit history from cloned repo."""
+    if PYGIT2_AVAILABLE:
+        try:
+            repo = pygit2.Repository(repo_path)
+            if repo.head_is_unborn:
+                return []
+            walker = repo.walk(repo.head.target, pygit2.GIT_SORT_TIME | pygit2.GIT_SORT_REVERSE)
+            return [
+                {"hash": str(commit.id)[:7], "message": commit.message.splitlines()[0] if commit.message else ""}
+                for commit in walker
+            ]
+        except Exception as e:
+            logger.warning(f"⚠️ pygit2 history walk failed ({e}); falling back to git log.")
     try:
+        # -z NUL-separates records and \x1f splits hash from subject, so each
+        # commit costs exactly one split and subjects with odd whitespace
+        # can't be mis-parsed the way --oneline + split(' ', 1) could
         result = subprocess.run(
-            ["git", "log", "--oneline", "--reverse"],
+            ["git", "log", "--reverse", "-z", "--pretty=format:%h%x1f%s"],
             cwd=repo_path, capture_output=True, text=True, timeout=30
         )
-        commits = []
-        for line in result.stdout.split('\n'):
-            if line.strip():
-                parts = line.split(' ', 1)
-                if len(parts) == 2:
-                    commits.append({"hash": parts[0], "message": parts[1]})
-        return commits
+        return [
+            {"hash": h, "message": msg}
+            for record in result.stdout.split('\x00') if record
+            for h, _, msg in (record.partition('\x1f'),)
+        ]
     except Exception as e:
         logger.error(f"⚠️ Error getting git history: {e}")
         return []
 
 
+_SKIP_DIRS = frozenset({'.git', '__pycache__'})
+
+
+def _walk_py(base: str, prefix: str, out: List[str]) -> None:
+    """scandir-based walker: DirEntry carries cached type info, and relative
+    paths build from the running prefix with no per-file relpath/stat."""
+    try:
+        it = os.scandir(base)
+    except OSError:
+        # Unreadable directory: skip it and keep walking, like os.walk
+        # does with its default onerror=None
+        return
+    with it:
+        for entry in it:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name not in _SKIP_DIRS:
+                    _walk_py(entry.path, prefix + name + "/", out)
+            elif name.endswith('.py'):
+                out.append(prefix + name)
+
+
 def find_python_files(repo_path: str) -> List[str]:
     """Find all .py files in repo."""
-    py_files = []
+    py_files: List[str] = []
     try:
-        for root, dirs, files in os.walk(repo_path):
-            if '.git' in dirs: dirs.remove('.git')
-            if '__pycache__' in dirs: dirs.remove('__pycache__')
-            for file in files:
-                if file.endswith('.py'):
-                    rel_path = os.path.relpath(os.path.join(root, file), repo_path)
-                    py_files.append(rel_path)
+        _walk_py(repo_path, "", py_files)
     except Exception as e:
         logger.error(f"⚠️ Error finding Python files: {e}")
     return py_files
 
 
-class OrchestrationVisitor(ast.NodeVisitor):
-    """AST visitor to detect LangGraph orchestration patterns."""
+# Resolved once at import; ripgrep is optional tooling, not a dependency
+_RG_PATH = shutil.which("rg")
+
+
+def _grep_candidate_files(repo_path: str, patterns) -> Union[List[str], None]:
+    """Find .py files containing any of the literal patterns, natively.
+
+    Prefers ripgrep, which fuses the directory walk and a SIMD-accelerated
+    multi-substring scan into one parallel pass, then falls back to
+    `git grep`. Returns None when neither native scanner is usable, letting
+    callers fall back to the Python walk.
+    """
+    if _RG_PATH is not None:
+        cmd = [_RG_PATH, "-l", "--type", "py", "--fixed-strings"]
+        for pattern in patterns:
+            cmd.extend(["-e", pattern])
+        cmd.append(".")
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30, cwd=repo_path)
+            # 0 = matches, 1 = no matches; 2 means rg itself failed
+            if result.returncode in (0, 1):
+                return [line.removeprefix("./") for line in result.stdout.splitlines() if line]
+        except Exception as e:
+            logger.warning(f"⚠️ ripgrep failed ({e}); trying git grep.")
+    return _git_grep_files(repo_path, patterns)
+
+
+def _git_grep_files(repo_path: str, patterns) -> Union[List[str], None]:
+    """Find files containing any of the literal patterns via one `git grep`.
+
+    git scans with mmap + native string search and skips ignored/binary
+    files, so this replaces a read-every-file Python loop with a single
+    subprocess. Returns None when git grep cannot run (non-git directory),
+    letting callers fall back to the Python walk.
+    """
+    cmd = ["git", "-C", repo_path, "grep", "-l", "--fixed-strings"]
+    for pattern in patterns:
+        cmd.extend(["-e", pattern])
+    cmd.extend(["--", "*.py"])
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    except Exception as e:
+        logger.warning(f"⚠️ git grep unavailable ({e}); falling back to file walk.")
+        return None
+    # 0 = matches, 1 = no matches; anything else means grep itself failed
+    if result.returncode not in (0, 1):
+        return None
+    return [line for line in result.stdout.splitlines() if line]
+
+
+class OrchestrationVisitor:
+    """Detects LangGraph orchestration patterns in a parsed module.
+
+    Deliberately not an ast.NodeVisitor: generic_visit costs a Python method
+    dispatch per node, but only Call nodes matter here. An explicit stack
+    with type() checks skips that dispatch for the vast majority of nodes.
+    """
     def __init__(self):
         self.nodes = []
         self.edges = []
@@ -82,33 +231,33 @@ class OrchestrationVisitor(ast.NodeVisitor):
         self.fan_in_detected = False
         self.state_graph_instantiated = False
 
-    def visit_Call(self, node):
-        if isinstance(node.func, ast.Name) and node.func.id == 'StateGraph':
-            self.state_graph_instantiated = True
-        
-        if isinstance(node.func, ast.Attribute):
-            if node.func.attr == 'add_node':
-                if len(node.args) > 0 and isinstance(node.args[0], ast.Constant):
-                    val = node.args[0].value
-                    self.nodes.append(val)
-            elif node.func.attr == 'add_edge':
-                if len(node.args) >= 2:
-                    start = None
-                    end = None
-                    if isinstance(node.args[0], ast.Constant):
-                        start = node.args[0].value
-                    if isinstance(node.args[1], ast.Constant):
-                        end = node.args[1].value
-                    if start and end:
-                        self.edges.append((start, end))
-            elif node.func.attr == 'add_conditional_edges':
-                if len(node.args) >= 1:
-                    source = None
-                    if isinstance(node.args[0], ast.Constant):
-                        source = node.args[0].value
-                    if source:
-                        self.conditional_edges.append(source)
-        self.generic_visit(node)
+    def visit(self, tree):
+        stack = [tree]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            node = pop()
+            if type(node) is ast.Call:
+                func = node.func
+                func_type = type(func)
+                if func_type is ast.Name:
+                    if func.id == 'StateGraph':
+                        self.state_graph_instantiated = True
+                elif func_type is ast.Attribute:
+                    attr = func.attr
+                    args = node.args
+                    if attr == 'add_node':
+                        if args and type(args[0]) is ast.Constant:
+                            self.nodes.append(args[0].value)
+                    elif attr == 'add_edge':
+                        if len(args) >= 2 and type(args[0]) is ast.Constant and type(args[1]) is ast.Constant:
+                            start, end = args[0].value, args[1].value
+                            if start and end:
+                                self.edges.append((start, end))
+                    elif attr == 'add_conditional_edges':
+                        if args and type(args[0]) is ast.Constant and args[0].value:
+                            self.conditional_edges.append(args[0].value)
+            push(ast.iter_child_nodes(node))
 
     def analyze(self):
         sources = [e[0] for e in self.edges]
@@ -120,30 +269,79 @@ class OrchestrationVisitor(ast.NodeVisitor):
         if self.conditional_edges: self.fan_out_detected = True
 
 
+# Candidate-file count at which the AST pass fans out to worker processes;
+# below this, fork overhead outweighs the parse time
+_PARALLEL_AST_THRESHOLD = 32
+
+
+def _orchestration_facts_for(full_path: str) -> Union[tuple, None]:
+    """Stat-then-parse wrapper; top-level so it pickles into pool workers."""
+    try:
+        st = os.stat(full_path)
+        return _orchestration_facts(full_path, st.st_mtime_ns, st.st_size)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=2048)
+def _orchestration_facts(full_path: str, mtime_ns: int, size: int) -> Union[tuple, None]:
+    """Parse one file and reduce its orchestration signals to a flat tuple.
+
+    Keyed by (path, mtime, size) so repeat detective passes over the same
+    checkout skip the read and ast.parse entirely; None means the file has
+    no orchestration markers at all.
+    """
+    with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    if 'StateGraph' not in content and 'add_node' not in content:
+        return None
+    tree = ast.parse(content)
+    visitor = OrchestrationVisitor()
+    visitor.visit(tree)
+    visitor.analyze()
+    return (
+        visitor.state_graph_instantiated, len(visitor.nodes), len(visitor.edges),
+        visitor.fan_out_detected, visitor.fan_in_detected,
+    )
+
+
 def verify_parallel_orchestration(repo_path: str) -> Evidence:
     """Advanced AST analysis of Graph Orchestration Architecture."""
-    py_files = find_python_files(repo_path)
+    # Narrow to candidate files with one native scan (rg, else git grep);
+    # the substring guard below still covers the fallback walk
+    py_files = _grep_candidate_files(repo_path, ("StateGraph", "add_node"))
+    if py_files is None:
+        py_files = find_python_files(repo_path)
     total_nodes, total_edges = 0, 0
     fan_out, fan_in, instantiated = False, False, False
     found_files = []
 
-    for file in py_files:
+    full_paths = [os.path.join(repo_path, file) for file in py_files]
+    if len(full_paths) >= _PARALLEL_AST_THRESHOLD:
+        # ast.parse is pure CPU; shard files across processes. Affinity, not
+        # cpu_count: under cgroups/containers only a subset may be usable.
         try:
-            with open(Path(repo_path) / file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            if 'StateGraph' not in content and 'add_node' not in content: continue
-            tree = ast.parse(content)
-            visitor = OrchestrationVisitor()
-            visitor.visit(tree)
-            visitor.analyze()
-            if visitor.state_graph_instantiated or visitor.nodes:
-                instantiated = True
-                total_nodes += len(visitor.nodes)
-                total_edges += len(visitor.edges)
-                if visitor.fan_out_detected: fan_out = True
-                if visitor.fan_in_detected: fan_in = True
-                found_files.append(file)
-        except Exception: continue
+            workers = len(os.sched_getaffinity(0))
+        except AttributeError:  # non-Linux
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(full_paths))
+        chunksize = max(1, len(full_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            all_facts = list(pool.map(_orchestration_facts_for, full_paths, chunksize=chunksize))
+    else:
+        # Serial path also keeps the parent-process memo cache hot
+        all_facts = [_orchestration_facts_for(path) for path in full_paths]
+
+    for file, facts in zip(py_files, all_facts):
+        if facts is None: continue
+        graph_instantiated, n_nodes, n_edges, file_fan_out, file_fan_in = facts
+        if graph_instantiated or n_nodes:
+            instantiated = True
+            total_nodes += n_nodes
+            total_edges += n_edges
+            if file_fan_out: fan_out = True
+            if file_fan_in: fan_in = True
+            found_files.append(file)
 
     if instantiated:
         status = "Master Thinker" if (fan_out and fan_in) else "Competent"
@@ -183,10 +381,11 @@ def analyze_git_evolution(repo_path: str) -> Evidence:
     return Evidence(goal="Git Evolution Discovery", found=len(signals) > 0, content=" | ".join(signals), location="git history", rationale=f"[{status}] {rationale}", confidence=confidence)
 
 
-def analyze_repo_structure(repo_path: str) -> Evidence:
+def analyze_repo_structure(repo_path: str, py_files: Optional[List[str]] = None) -> Evidence:
     """Analyze overall repository structure."""
     try:
-        py_files = find_python_files(repo_path)
+        if py_files is None:
+            py_files = find_python_files(repo_path)
         top_level_modules = [item for item in os.listdir(repo_path) if os.path.isdir(os.path.join(repo_path, item)) and not item.startswith('.') and item not in ['tests', 'docs', 'examples', 'venv', '__pycache__']]
         has_tests = os.path.isdir(os.path.join(repo_path, 'tests'))
         structure = [f"Modules: [{', '.join(top_level_modules)}]", f"Total Python Files: {len(py_files)}"]
@@ -213,9 +412,10 @@ def detect_ci_presence(repo_path: str) -> Evidence:
     return Evidence(goal="CI/CD Infrastructure", found=False, location="repository root", rationale="No CI found", confidence=0.8)
 
 
-def detect_tests_folder(repo_path: str) -> Evidence:
+def detect_tests_folder(repo_path: str, py_files: Optional[List[str]] = None) -> Evidence:
     """Detect testing infrastructure."""
-    py_files = find_python_files(repo_path)
+    if py_files is None:
+        py_files = find_python_files(repo_path)
     test_files = [f for f in py_files if f.startswith("test_") or f.endswith("_test.py") or "/test_" in f or f.startswith("tests/")]
     if test_files:
         ratio = len(test_files) / max(len(py_files) - len(test_files), 1)
@@ -223,73 +423,118 @@ def detect_tests_folder(repo_path: str) -> Evidence:
     return Evidence(goal="Test Infrastructure", found=False, location="repository", rationale="No tests found.", confidence=0.8)
 
 
-def scan_secrets(repo_path: str) -> Evidence:
+def scan_secrets(repo_path: str, py_files: Optional[List[str]] = None) -> Evidence:
     """Scan for secrets."""
     import re
-    patterns = [r"(?i)api_key\s*=\s*['\"][a-zA-Z0-9_\-]{16,}['\"]", r"AKIA[0-9A-Z]{16}"]
-    found = []
-    for f in find_python_files(repo_path):
+    # Bytes patterns: matching on read_bytes() skips the per-file UTF-8 decode
+    patterns = [re.compile(rb"(?i)api_key\s*=\s*['\"][a-zA-Z0-9_\-]{16,}['\"]"), re.compile(rb"AKIA[0-9A-Z]{16}")]
+
+    def _scan(rel: str) -> Optional[str]:
         try:
-            with open(Path(repo_path) / f, 'r', encoding='utf-8', errors='ignore') as file:
-                content = file.read()
-                if any(re.search(p, content) for p in patterns): found.append(f)
-        except Exception: pass
+            data = (Path(repo_path) / rel).read_bytes()
+            return rel if any(p.search(data) for p in patterns) else None
+        except Exception:
+            return None
+
+    files = py_files if py_files is not None else find_python_files(repo_path)
+    # read() releases the GIL, so a small thread pool overlaps the blocking
+    # I/O of a cold page cache; map preserves file order for found[0] below
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        found = [rel for rel in ex.map(_scan, files) if rel]
     if found: return Evidence(goal="Secrets Scanning", found=True, content=found[0], location=found[0], rationale=f"Potential secrets in {len(found)} files.", confidence=0.8)
     return Evidence(goal="Secrets Scanning", found=False, location="repository", rationale="No secrets detected.", confidence=0.7)
 
 
-def detect_structured_output_nuance(repo_path: str) -> Evidence:
-    """Detect structured output patterns."""
-    patterns = {"BaseModel": 0.4, "TypedDict": 0.3, "dataclass": 0.2, "Field": 0.1}
-    confidence = 0.0
-    found_signals = set()
-    for f in find_python_files(repo_path):
+def _mmap_find_signals(full_path: str, needles) -> set:
+    """Return the pattern strings from (pattern, bytes) pairs present in a file.
+
+    Searches through a read-only mmap: the literal scan runs on raw bytes,
+    skipping the UTF-8 decode and str copy that open().read() would pay just
+    to answer a containment question.
+    """
+    with open(full_path, 'rb') as f:
         try:
-            with open(Path(repo_path) / f, 'r', encoding='utf-8', errors='ignore') as file:
-                content = file.read()
-                for p, w in patterns.items():
-                    if p in content and p not in found_signals:
-                        confidence += w
-                        found_signals.add(p)
-        except Exception: pass
-    confidence = min(1.0, confidence)
-    return Evidence(goal="Structured Output Enforcement", found=confidence > 0.3, content=", ".join(found_signals), location="repository", rationale=f"Patterns detected: {', '.join(found_signals)}. Confidence: {confidence:.2f}", confidence=confidence)
-
-
-def detect_safe_tool_nuance(repo_path: str) -> Evidence:
-    """Detect safe tool patterns."""
-    patterns = {"@validator": 0.4, "validate_": 0.3, "sanitize": 0.2, "subprocess.run": 0.1}
-    confidence = 0.0
-    found_signals = set()
-    for f in find_python_files(repo_path):
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return set()
         try:
-            with open(Path(repo_path) / f, 'r', encoding='utf-8', errors='ignore') as file:
-                content = file.read()
-                for p, w in patterns.items():
-                    if p in content and p not in found_signals:
-                        confidence += w
-                        found_signals.add(p)
-        except Exception: pass
-    confidence = min(1.0, confidence)
-    return Evidence(goal="Safe Tool Engineering", found=confidence > 0.3, content=", ".join(found_signals), location="repository", rationale=f"Patterns detected: {', '.join(found_signals)}. Confidence: {confidence:.2f}", confidence=confidence)
-
-
-def detect_judicial_nuance(repo_path: str) -> Evidence:
-    """Detect judicial reasoning patterns."""
-    patterns = {"reasoning_trace": 0.4, "arbitration": 0.3, "variance": 0.2, "weight": 0.1}
-    confidence = 0.0
-    found_signals = set()
-    for f in find_python_files(repo_path):
+            return {pattern for pattern, raw in needles if mm.find(raw) != -1}
+        finally:
+            mm.close()
+
+
+# Signature groups for the nuance detectors; the union feeds the fused
+# single-pass scan below
+_STRUCTURED_OUTPUT_PATTERNS = {"BaseModel": 0.4, "TypedDict": 0.3, "dataclass": 0.2, "Field": 0.1}
+_SAFE_TOOL_PATTERNS = {"@validator": 0.4, "validate_": 0.3, "sanitize": 0.2, "subprocess.run": 0.1}
+_JUDICIAL_PATTERNS = {"reasoning_trace": 0.4, "arbitration": 0.3, "variance": 0.2, "weight": 0.1}
+
+_ALL_NUANCE_NEEDLES = tuple(
+    (p, p.encode())
+    for group in (_STRUCTURED_OUTPUT_PATTERNS, _SAFE_TOOL_PATTERNS, _JUDICIAL_PATTERNS)
+    for p in group
+)
+
+
+def _signal_presence_scan(repo_path: str, needles: tuple, py_files: Optional[List[str]]) -> set:
+    """Which of the given signature needles appear anywhere in the repo.
+
+    Every file is mmap-scanned exactly once for the whole needle set, in
+    chunks across a small thread pool so the blocking page-ins overlap; the
+    between-chunk check stops the walk once every needle has been seen.
+    """
+    found: set = set()
+    files = py_files if py_files is not None else find_python_files(repo_path)
+
+    def _scan(rel: str):
         try:
-            with open(Path(repo_path) / f, 'r', encoding='utf-8', errors='ignore') as file:
-                content = file.read()
-                for p, w in patterns.items():
-                    if p in content and p not in found_signals:
-                        confidence += w
-                        found_signals.add(p)
-        except Exception: pass
-    confidence = min(1.0, confidence)
-    return Evidence(goal="Judicial Nuance", found=confidence > 0.3, content=", ".join(found_signals), location="repository", rationale=f"Patterns detected: {', '.join(found_signals)}. Confidence: {confidence:.2f}", confidence=confidence)
+            return _mmap_find_signals(os.path.join(repo_path, rel), needles)
+        except Exception:
+            # Unreadable files (dangling symlinks, permissions) are skipped,
+            # matching the old serial loop; must stay a set for found |= hits
+            return set()
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        for start in range(0, len(files), 32):
+            for hits in ex.map(_scan, files[start:start + 32]):
+                found |= hits
+            if len(found) == len(needles):
+                break
+    return found
+
+
+def scan_repo_signatures(repo_path: str, py_files: Optional[List[str]] = None) -> set:
+    """Single fused pass over every nuance signature group.
+
+    One scan per file for all twelve needles instead of one pass per
+    detector - pass the result into the detect_*_nuance functions to avoid
+    re-reading the tree three times.
+    """
+    return _signal_presence_scan(repo_path, _ALL_NUANCE_NEEDLES, py_files)
+
+
+def _nuance_evidence(goal: str, patterns: Dict[str, float], repo_path: str,
+                     py_files: Optional[List[str]], signal_hits: Optional[set]) -> Evidence:
+    if signal_hits is None:
+        signal_hits = _signal_presence_scan(repo_path, tuple((p, p.encode()) for p in patterns), py_files)
+    found_signals = {p for p in patterns if p in signal_hits}
+    confidence = min(1.0, sum(patterns[p] for p in found_signals))
+    return Evidence(goal=goal, found=confidence > 0.3, content=", ".join(found_signals), location="repository", rationale=f"Patterns detected: {', '.join(found_signals)}. Confidence: {confidence:.2f}", confidence=confidence)
+
+
+def detect_structured_output_nuance(repo_path: str, py_files: Optional[List[str]] = None, signal_hits: Optional[set] = None) -> Evidence:
+    """Detect structured output patterns."""
+    return _nuance_evidence("Structured Output Enforcement", _STRUCTURED_OUTPUT_PATTERNS, repo_path, py_files, signal_hits)
+
+
+def detect_safe_tool_nuance(repo_path: str, py_files: Optional[List[str]] = None, signal_hits: Optional[set] = None) -> Evidence:
+    """Detect safe tool patterns."""
+    return _nuance_evidence("Safe Tool Engineering", _SAFE_TOOL_PATTERNS, repo_path, py_files, signal_hits)
+
+
+def detect_judicial_nuance(repo_path: str, py_files: Optional[List[str]] = None, signal_hits: Optional[set] = None) -> Evidence:
+    """Detect judicial reasoning patterns."""
+    return _nuance_evidence("Judicial Nuance", _JUDICIAL_PATTERNS, repo_path, py_files, signal_hits)
 
 
 def main_detective_work(repo_url: str, full_history: bool = False) -> List[Evidence]:
@@ -303,16 +548,21 @@ def main_detective_work(repo_url: str, full_history: bool = False) -> List[Evide
     evidences.append(Evidence(goal="Repository Access", found=True, content="Cloned", location=repo_url, rationale="Cloned successfully.", confidence=0.9))
     
     try:
+        # One tree walk feeds every scanner below; each still walks on its
+        # own when called standalone
+        py_files = find_python_files(repo_path)
         evidences.append(analyze_git_evolution(repo_path))
         evidences.append(verify_parallel_orchestration(repo_path))
-        evidences.append(analyze_repo_structure(repo_path))
+        evidences.append(analyze_repo_structure(repo_path, py_files))
         evidences.append(detect_license(repo_path))
         evidences.append(detect_ci_presence(repo_path))
-        evidences.append(detect_tests_folder(repo_path))
-        evidences.append(scan_secrets(repo_path))
-        evidences.append(detect_structured_output_nuance(repo_path))
-        evidences.append(detect_safe_tool_nuance(repo_path))
-        evidences.append(detect_judicial_nuance(repo_path))
+        evidences.append(detect_tests_folder(repo_path, py_files))
+        evidences.append(scan_secrets(repo_path, py_files))
+        # One fused signature pass feeds all three nuance detectors
+        signal_hits = scan_repo_signatures(repo_path, py_files)
+        evidences.append(detect_structured_output_nuance(repo_path, py_files, signal_hits))
+        evidences.append(detect_safe_tool_nuance(repo_path, py_files, signal_hits))
+        evidences.append(detect_judicial_nuance(repo_path, py_files, signal_hits))
     except Exception as e:
         logger.error(f"Error: {e}")
         evidences.append(Evidence(goal="Repository Analysis", found=False, content=str(e), location=repo_url, rationale=f"Error: {e}", confidence=0.0))
@@ -15,10 +15,14 @@ class MockReport:
         self.overall_score = overall_score
         self.criteria = [MockCriterion()]
 
-def test_generate_calibration_curves_logic(caplog):
+def test_generate_calibration_curves_logic(caplog, tmp_path, monkeypatch):
     """Test the calculation and formatting output logic implicitly by reading logs."""
     import logging
-    
+
+    # The curve generator writes benchmark_report.md to the cwd; run from a
+    # tmp dir so the test never rewrites the repo's committed report
+    monkeypatch.chdir(tmp_path)
+
     with caplog.at_level(logging.INFO):
         tier_stats = {
             "High": [MockReport(4.5), MockReport(5.0)]
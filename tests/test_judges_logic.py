@@ -0,0 +1,90 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from src.nodes import judges as judges_module
+from src.nodes.judges import BatchJudgePanelNode, ProsecutorNode, _DEFAULT_RUBRIC
+from src.state import AgentState, JudicialOpinion
+
+
+class _StubChain:
+    """Stands in for the LLM chain; yields so semaphore waiters actually queue."""
+
+    async def ainvoke(self, payload):
+        await asyncio.sleep(0.001)
+        return JudicialOpinion(
+            judge=payload["judge_name"],
+            criterion_id=payload["criterion_id"],
+            score=5,
+            argument="Stubbed opinion",
+            cited_evidence_ids=[],
+        )
+
+
+async def _no_preflight(self):
+    return None
+
+
+def test_panel_survives_concurrency_below_dimension_count(monkeypatch):
+    """
+    JUDGE_CONCURRENCY below the rubric size must not poison later judges.
+    Each judge node drives its own asyncio.run loop; a semaphore shared
+    across loops binds to the first one and every later panel degrades to
+    error-fallback opinions as soon as the limit actually blocks.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(judges_module, "_JUDGE_CONCURRENCY", 2)
+    monkeypatch.setattr(judges_module.BaseJudgeNode, "_preflight_probe", _no_preflight)
+
+    node = ProsecutorNode()
+    node.chain = _StubChain()
+    state = AgentState(repo_url="https://github.com/test", pdf_path="")
+
+    # Two panel runs = two separate event loops, like two judges in the graph
+    for _ in range(2):
+        opinions = node(state)["opinions"]
+        assert len(opinions) == len(_DEFAULT_RUBRIC)
+        # Fallback opinions carry score 1 for the Prosecutor; a healthy
+        # panel returns only the stubbed 5s
+        assert [op.score for op in opinions] == [5] * len(_DEFAULT_RUBRIC)
+
+
+def test_batch_panel_builds_one_request_per_judge_and_criterion(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    node = BatchJudgePanelNode()
+    state = AgentState(repo_url="https://github.com/test", pdf_path="")
+
+    requests = node._build_batch_requests(state, _DEFAULT_RUBRIC)
+
+    assert len(requests) == 3 * len(_DEFAULT_RUBRIC)
+    judges = {r["custom_id"].split(":", 1)[0] for r in requests}
+    assert judges == {"Prosecutor", "Defense", "TechLead"}
+    assert all(r["body"]["response_format"] == {"type": "json_object"} for r in requests)
+
+
+def test_batch_panel_parses_opinion_and_falls_back_on_garbage(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    node = BatchJudgePanelNode()
+    ts = datetime.now()
+
+    def _line(judge, content):
+        return json.dumps({
+            "custom_id": f"{judge}:structured_output",
+            "response": {"body": {"choices": [{"message": {"content": content}}]}},
+        })
+
+    good = json.dumps({
+        "judge": "TechLead", "criterion_id": "structured_output",
+        "score": 4, "argument": "Solid models", "cited_evidence_ids": [],
+    })
+    opinion = node._parse_output_line(_line("TechLead", good), ts)
+    assert opinion.score == 4
+    assert opinion.timestamp == ts
+
+    # Malformed content degrades to the judge's fallback score, not a crash
+    fallback = node._parse_output_line(_line("Defense", "not json at all"), ts)
+    assert fallback.judge == "Defense"
+    assert fallback.criterion_id == "structured_output"
+    assert fallback.score == 3
@@ -8,7 +8,8 @@ from src.tools.repo_tools import (
     detect_license,
     detect_ci_presence,
     detect_tests_folder,
-    scan_secrets
+    scan_secrets,
+    scan_repo_signatures
 )
 
 @pytest.fixture
@@ -62,3 +63,16 @@ def test_scan_secrets(mock_repo):
     assert ev.found is True
     assert ev.goal == "Secrets Scanning"
     assert "main.py" in ev.content
+
+
+def test_scan_repo_signatures_skips_unreadable_files(mock_repo):
+    # A dangling symlink must be skipped like any unreadable file, not
+    # abort the fused signature scan
+    with open(os.path.join(mock_repo, "models.py"), "w") as f:
+        f.write("from pydantic import BaseModel\n")
+    os.symlink(
+        os.path.join(mock_repo, "does_not_exist.py"),
+        os.path.join(mock_repo, "dangling.py"),
+    )
+    hits = scan_repo_signatures(mock_repo)
+    assert "BaseModel" in hits